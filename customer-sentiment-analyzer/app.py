@@ -8,44 +8,239 @@ Run with: streamlit run app.py
 """
 
 import os
-import json
+import sys
+import tempfile
+import threading
 from pathlib import Path
+import orjson
 import streamlit as st
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
+API_KEY = os.getenv("ANTHROPIC_API_KEY")
 
 # Results persistence
 RESULTS_FILE = Path(__file__).parent / "data" / "last_analysis.json"
-
-# Import cache manager
-from src.analysis_cache import AnalysisCache
-from config.settings import CACHE_FILE, RECENT_WINDOW_DAYS, CLOSED_STATUSES, normalize_case_number
-from src.dashboard.filters import filter_recent_issues
+RESULTS_IO_BUFFER = 64 * 1024  # Large buffer collapses syscalls for multi-MB results
+RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+# AnalysisCache (and pandas behind it) is imported lazily in get_cache
+from config.settings import CACHE_FILE, RECENT_WINDOW_DAYS, CLOSED_STATUSES_DISPLAY, CLOSED_STATUSES_NORM, normalize_case_number
+from src.atomic_file import match_target_mode
+from src.results_store import decode_results, encode_results
+
+
+# Low-cardinality labels repeated on every case: (sub-dict or None, field)
+INTERNED_CASE_FIELDS = (
+    (None, "severity"),
+    (None, "support_level"),
+    ("claude_analysis", "resolution_outlook"),
+    ("claude_analysis", "issue_class"),
+    ("deepseek_analysis", "sentiment_trend"),
+)
 
 
-def save_results(results: dict):
-    """Save analysis results to disk for persistence across refreshes."""
-    RESULTS_FILE.parent.mkdir(exist_ok=True)
-    with open(RESULTS_FILE, "w") as f:
-        json.dump(results, f, default=str)
+def _intern_case_labels(results: dict) -> dict:
+    """Intern the categorical labels on each case so repeats share one string object."""
+    intern = sys.intern
+    for case in results.get("cases") or ():
+        for parent, field in INTERNED_CASE_FIELDS:
+            target = case.get(parent) if parent else case
+            if target and type(target.get(field)) is str:
+                target[field] = intern(target[field])
+    return results
+
+
+class _ResultsWriter:
+    """Process-wide coordination between background saves and Clear Results.
+
+    Every save request and every clear bumps ``generation``; a save only moves
+    its temp file into place if no newer save or clear happened meanwhile.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.generation = 0
+
+    def next_generation(self) -> int:
+        with self.lock:
+            self.generation += 1
+            return self.generation
+
+
+@st.cache_resource(show_spinner=False)
+def _results_writer() -> _ResultsWriter:
+    # Cached so the lock and counter survive reruns (this script re-executes each time)
+    return _ResultsWriter()
+
+
+def save_results(results: dict, generation: int | None = None):
+    """Save analysis results to disk for persistence across refreshes.
+
+    Writes to a unique sibling temp file and renames it into place, so a
+    crash or rerun mid-write never leaves a truncated JSON behind, and
+    overlapping background saves cannot clobber each other's temp file.
+
+    Args:
+        results: Analysis results to persist
+        generation: Writer generation this save was requested under. If a newer
+            save or a clear has happened since, the write is discarded.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=RESULTS_FILE.parent, suffix=".json.tmp")
+    try:
+        with open(fd, "wb", buffering=RESULTS_IO_BUFFER) as f:
+            f.write(encode_results(results))
+        writer = _results_writer()
+        with writer.lock:
+            if generation is not None and generation != writer.generation:
+                Path(tmp_path).unlink(missing_ok=True)  # superseded or cleared
+                return
+            match_target_mode(tmp_path, RESULTS_FILE)
+            os.replace(tmp_path, RESULTS_FILE)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def save_results_in_background(results: dict):
+    """Persist results without blocking the UI - session state already holds them."""
+    generation = _results_writer().next_generation()
+    threading.Thread(target=save_results, args=(results, generation), daemon=True).start()
+
+
+def clear_saved_results():
+    """Delete the saved results, cancelling any background save still in flight."""
+    writer = _results_writer()
+    with writer.lock:
+        writer.generation += 1
+        RESULTS_FILE.unlink(missing_ok=True)
+    load_results_cached.clear()
+
+
+@st.cache_data(show_spinner=False)
+def load_results_cached(path_mtime: int) -> dict | None:
+    """Parse the results file once per process for a given modification time.
+
+    cache_data hands each session its own copy, so a session editing its
+    results in place cannot leak into another session's view.
+    """
+    try:
+        with open(RESULTS_FILE, "rb", buffering=RESULTS_IO_BUFFER) as f:
+            return _intern_case_labels(decode_results(f.read()))
+    except (FileNotFoundError, orjson.JSONDecodeError, OSError):
+        return None
 
 
 def load_results() -> dict | None:
     """Load saved analysis results from disk."""
-    if RESULTS_FILE.exists():
-        try:
-            with open(RESULTS_FILE) as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return None
-    return None
-
-# Import our modules
-from src.sentiment_analyzer import SentimentAnalyzer
-from src.dashboard.branding import COLORS, get_health_color, get_health_status
+    # Keyed by mtime so a fresh save is picked up while cold sessions reuse the parse;
+    # the steady state costs one stat() call. Nanoseconds so back-to-back saves differ.
+    try:
+        path_mtime = os.stat(RESULTS_FILE).st_mtime_ns
+    except OSError:
+        return None
+    return load_results_cached(path_mtime)
+
+# Import our modules (SentimentAnalyzer is imported lazily in build_analyzer -
+# it pulls in the Anthropic SDK, which sessions that only browse results never need)
+from src.dashboard.branding import COLORS, SIDEBAR_HEADER_HTML, get_health_color, get_health_status
 from src.dashboard.styles import get_global_css
+from src.dashboard.session import clear_analysis_results, set_analysis_results
+
+# Static HTML fragments - COLORS is constant, so bake it in once instead of
+# re-interpolating it on every rerun. Templates keep {placeholders} for the
+# few values that change and are filled with str.format().
+API_KEY_OK_HTML = f"""
+            <div style="background: {COLORS['success_tint']}; padding: 0.5rem 1rem; border-radius: 6px;
+                        border: 1px solid {COLORS['success']}; margin-bottom: 0.5rem;">
+                <span style="color: {COLORS['success']};">&#10003; API Key Configured</span>
+            </div>
+            """
+
+HEALTH_CARD_TEMPLATE = f"""
+            <div style="background: {COLORS['surface']}; padding: 1rem; border-radius: 8px;
+                        border: 1px solid {COLORS['border']}; text-align: center;">
+                <p style="color: {COLORS['text_muted']}; margin: 0; font-size: 0.8rem;">Account Health</p>
+                <p style="color: {{health_color}}; margin: 5px 0; font-size: 2rem; font-weight: bold;">{{health_score:.0f}}</p>
+                <p style="color: {{health_color}}; margin: 0; font-size: 0.9rem;">{{health_status}}</p>
+            </div>
+            """
+
+RUN_SUMMARY_TEMPLATE = f"""
+            <div style="margin-top: 1rem; padding: 0.5rem; background: {COLORS['surface']};
+                        border-radius: 6px; border: 1px solid {COLORS['border']};">
+                <p style="color: {COLORS['text_muted']}; margin: 0; font-size: 0.75rem;">
+                    {{total_cases}} cases analyzed<br/>
+                    {{total_time:.1f}}s total time
+                </p>
+            </div>
+            """
+
+ANALYSIS_PARAMS_HEADING_HTML = f"<p style='color: {COLORS['text']}; font-weight: 600;'>Analysis Parameters</p>"
+
+MAIN_HEADER_HTML = f"""
+    <div style="background: linear-gradient(135deg, {COLORS['surface']} 0%, {COLORS['background']} 100%);
+                padding: 1.5rem; border-radius: 12px; margin-bottom: 1.5rem;
+                border: 1px solid {COLORS['border']}; border-left: 4px solid {COLORS['primary']};">
+        <h1 style="color: {COLORS['primary']}; margin: 0; font-size: 1.8rem;">Customer Sentiment Analyzer</h1>
+        <p style="color: {COLORS['text_muted']}; margin: 10px 0 0 0;">
+            Cache-first analysis with incremental updates
+        </p>
+    </div>
+    """
+
+CACHE_BANNER_TEMPLATE = f"""
+        <div style="background: {COLORS['success_tint']}; padding: 0.75rem 1rem; border-radius: 6px;
+                    border: 1px solid {COLORS['success']}; margin-bottom: 1rem;">
+            <span style="color: {COLORS['success']};">&#128202; Cache: {{open_cases}} open cases, {{closed_cases}} closed</span>
+        </div>
+        """
+
+SELECT_ACTION_HEADING_HTML = f"<h3 style='color: {COLORS['text']}'>Select Action</h3>"
+
+ATTENTION_HEADING_TEMPLATE = f"<h4 style='color: {COLORS['warning']}'>⚠️ Cases Needing Attention ({{count}})</h4>"
+
+ATTENTION_ROW_TEMPLATE = f"""
+                    <div style="background: {COLORS['surface']}; padding: 0.75rem; border-radius: 6px;
+                                border-left: 3px solid {COLORS['warning']}; margin-bottom: 0.5rem;">
+                        <strong style="color: {COLORS['text']};">{{customer_name}}</strong>
+                        <span style="color: {COLORS['text']};">- Case {{case_number}}</span><br/>
+                        <span style="color: {COLORS['text_muted']};">
+                            {{trend_icon}} Recent frustration: {{recent_frustration}}/10 |
+                            Trend: {{trend}}
+                        </span>
+                    </div>
+                    """
+
+CLOSED_UPLOAD_HINT_HTML = f"""
+        <div style="background: {COLORS['surface']}; padding: 1rem; border-radius: 8px;
+                    border: 1px solid {COLORS['border']}; margin-bottom: 1rem;">
+            <p style="color: {COLORS['text_muted']}; margin: 0;">
+                Upload a report of closed cases to update their status in the cache.
+                Cases with status matching: {', '.join(CLOSED_STATUSES_DISPLAY[:3])}... will be marked closed.
+            </p>
+        </div>
+        """
+
+HERO_METRIC_TEMPLATE = """
+            <div class="hero-metric"{card_style}>
+                <div class="hero-metric-value" style="{value_style}">{value}</div>
+                <div class="hero-metric-label">{label}</div>
+            </div>
+            """
+
+RESULTS_READY_HTML = f"""
+        <div style="background: linear-gradient(135deg, {COLORS['surface']} 0%, {COLORS['background']} 100%);
+                    padding: 1rem; border-radius: 8px; margin-bottom: 1rem;
+                    border: 1px solid {COLORS['border']}; border-left: 4px solid {COLORS['success']};">
+            <h3 style="color: {COLORS['success']}; margin: 0;">✓ Results Ready</h3>
+            <p style="color: {COLORS['text_muted']}; margin: 5px 0 0 0;">
+                Use sidebar navigation: <strong style="color: {COLORS['text']};">Overview</strong>, <strong style="color: {COLORS['text']};">Cases</strong>,
+                <strong style="color: {COLORS['text']};">Timeline</strong>, <strong style="color: {COLORS['text']};">Trends</strong>, <strong style="color: {COLORS['text']};">Export</strong>
+            </p>
+        </div>
+        """
 
 # Page configuration - MUST be first Streamlit command
 st.set_page_config(
@@ -55,27 +250,168 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+
+@st.cache_resource(show_spinner=False)
+def get_claude_client(api_key: str):
+    """Reuse one Anthropic client (and its connection pool) per API key across runs.
+
+    Only the client is shared - it holds no per-run state. The analyzer and its
+    DataLoader are built per run, since they carry the reference date, cache,
+    mode and progress callback of that run.
+    """
+    from src.claude_client import ClaudeClient
+    return ClaudeClient(api_key)
+
+
+def build_analyzer(api_key: str, progress_callback=None):
+    """Fresh SentimentAnalyzer for one run, on top of the shared client."""
+    from src.sentiment_analyzer import SentimentAnalyzer
+    return SentimentAnalyzer(client=get_claude_client(api_key), progress_callback=progress_callback)
+
+
+@st.cache_resource(show_spinner=False)
+def get_cache(path: str):
+    """One AnalysisCache per process - it is mutated in place and saved explicitly,
+    so it must be a shared singleton rather than a per-rerun copy."""
+    from src.analysis_cache import AnalysisCache
+    return AnalysisCache(path)
+
+
+def _cache_version() -> int:
+    """Cheap version token for the shared cache - the file mtime moves on every save_cache()."""
+    try:
+        return os.stat(CACHE_FILE).st_mtime_ns
+    except OSError:
+        return 0
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cache_stats(version: int) -> dict:
+    """Cache statistics for a given cache version."""
+    return get_cache(str(CACHE_FILE)).get_cache_stats()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _attention_cases(version: int, window: int, limit: int = 5) -> tuple[int, list[dict]]:
+    """Count of attention cases plus a lean copy of the top ``limit`` for display."""
+    attention = get_cache(str(CACHE_FILE)).get_cases_needing_attention(window)
+    top = [
+        {
+            "case_number": case.get("case_number"),
+            "customer_name": case.get("customer_name", "Unknown"),
+            "calculated_metrics": case.get("calculated_metrics", {}),
+        }
+        for case in attention[:limit]
+    ]
+    return len(attention), top
+
+
 # Apply global CSS
 st.markdown(get_global_css(), unsafe_allow_html=True)
 
 
+@st.fragment
+def upload_open_cases(api_key: str, cache, top_quick: int, top_detailed: int):
+    """Upload + Run Analysis flow.
+
+    Runs as a fragment so checkbox/uploader interactions rerun only this
+    block instead of the whole page (sidebar, banners, metrics).
+    """
+    uploaded_file = st.file_uploader(
+        "Upload Excel file with open support cases",
+        type=["xlsx", "xls"],
+        help="Excel file with columns: Case Number, Customer Name, Message, Severity, Message Date"
+    )
+
+    if uploaded_file is not None:
+        st.success(f"Loaded: {uploaded_file.name}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            force_full = st.checkbox(
+                "Force full re-analysis",
+                help="Re-analyze all messages even if cached (rebuilds cache)"
+            )
+        with col2:
+            incremental = st.checkbox(
+                "Incremental mode",
+                value=True,
+                help="Only analyze new messages (uses cached context)",
+                disabled=force_full
+            )
+
+        if st.button("Run Analysis", type="primary", disabled=not api_key, use_container_width=True):
+            if not api_key:
+                st.error("Please set ANTHROPIC_API_KEY in .env file.")
+                return
+
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+
+            def update_progress(message: str, progress: float):
+                progress_bar.progress(progress)
+                status_text.text(message)
+
+            try:
+                with st.spinner("Initializing..."):
+                    analyzer = build_analyzer(api_key, update_progress)
+
+                # Pass cache and mode to analyzer
+                results = analyzer.analyze(
+                    file=uploaded_file,
+                    top_quick=top_quick,
+                    top_detailed=top_detailed,
+                    cache=cache if not force_full else None,
+                    incremental=incremental and not force_full
+                )
+
+                # Save updated cache
+                cache.save_cache()
+
+                progress_bar.empty()
+                status_text.empty()
+
+                set_analysis_results(_intern_case_labels(results))
+                save_results_in_background(results)
+
+                st.success(f"Analysis complete! Processed {results['total_cases']} cases.")
+                st.rerun()
+
+            except Exception as e:
+                progress_bar.empty()
+                status_text.empty()
+                st.error(f"Analysis failed: {str(e)}")
+                st.exception(e)
+
+
 def main():
     """Main application entry point - handles file upload and analysis."""
 
+    # Bind the palette entries main() still interpolates per rerun (static blocks
+    # are module-level templates) and the health helpers to locals once
+    _c = COLORS
+    primary, success, text = _c['primary'], _c['success'], _c['text']
+    warning, critical = _c['warning'], _c['critical']
+    _gh_color, _gh_status = get_health_color, get_health_status
+
     # Load saved results on startup (persists across page refreshes)
     if 'analysis_results' not in st.session_state:
         saved = load_results()
         if saved:
-            st.session_state['analysis_results'] = saved
+            set_analysis_results(saved)
+
+    # Destructure the summary fields once per rerun for the sidebar and metrics
+    results = st.session_state.get('analysis_results')
+    if results is not None:
+        timing = results.get("timing") or {}
+        total_time = timing.get("total_time", 0)
+        total_cases = results.get("total_cases", 0)
+        stats = (results.get("statistics") or {}).get("haiku") or {}
 
     # Sidebar with branding and controls
     with st.sidebar:
         # Branding header
-        st.markdown(f"""
-        <div style="text-align: center; padding: 0.5rem 0; border-bottom: 1px solid {COLORS['border']}; margin-bottom: 0.75rem;">
-            <h3 style="color: {COLORS['primary']}; margin: 0;">Customer Sentiment</h3>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(SIDEBAR_HEADER_HTML)
 
         # View Mode Toggle - synced across all pages via session state
         if 'view_mode' not in st.session_state:
@@ -96,21 +432,16 @@ def main():
         st.divider()
 
         # API Key status (read from environment variable)
-        api_key = os.getenv("ANTHROPIC_API_KEY")
+        api_key = API_KEY
         if api_key:
-            st.markdown(f"""
-            <div style="background: {COLORS['success_tint']}; padding: 0.5rem 1rem; border-radius: 6px;
-                        border: 1px solid {COLORS['success']}; margin-bottom: 0.5rem;">
-                <span style="color: {COLORS['success']};">&#10003; API Key Configured</span>
-            </div>
-            """, unsafe_allow_html=True)
+            st.html(API_KEY_OK_HTML)
         else:
             st.warning("API key not found. Set ANTHROPIC_API_KEY in .env file.")
 
         st.divider()
 
         # Analysis parameters
-        st.markdown(f"<p style='color: {COLORS['text']}; font-weight: 600;'>Analysis Parameters</p>", unsafe_allow_html=True)
+        st.html(ANALYSIS_PARAMS_HEADING_HTML)
 
         top_quick = st.slider(
             "Quick Scoring (Top N)",
@@ -131,37 +462,27 @@ def main():
         st.divider()
 
         # Show analysis status if results exist
-        if 'analysis_results' in st.session_state:
-            results = st.session_state['analysis_results']
+        if results is not None:
             health_score = results.get('account_health_score', 0)
-            health_color = get_health_color(health_score)
-            health_status = get_health_status(health_score)
+            health_color = _gh_color(health_score)
+            health_status = _gh_status(health_score)
 
-            st.markdown(f"""
-            <div style="background: {COLORS['surface']}; padding: 1rem; border-radius: 8px;
-                        border: 1px solid {COLORS['border']}; text-align: center;">
-                <p style="color: {COLORS['text_muted']}; margin: 0; font-size: 0.8rem;">Account Health</p>
-                <p style="color: {health_color}; margin: 5px 0; font-size: 2rem; font-weight: bold;">{health_score:.0f}</p>
-                <p style="color: {health_color}; margin: 0; font-size: 0.9rem;">{health_status}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.html(HEALTH_CARD_TEMPLATE.format(
+                health_score=health_score,
+                health_color=health_color,
+                health_status=health_status,
+            ))
 
-            st.markdown(f"""
-            <div style="margin-top: 1rem; padding: 0.5rem; background: {COLORS['surface']};
-                        border-radius: 6px; border: 1px solid {COLORS['border']};">
-                <p style="color: {COLORS['text_muted']}; margin: 0; font-size: 0.75rem;">
-                    {results.get('total_cases', 0)} cases analyzed<br/>
-                    {results.get('timing', {}).get('total_time', 0):.1f}s total time
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.html(RUN_SUMMARY_TEMPLATE.format(
+                total_cases=total_cases,
+                total_time=total_time,
+            ))
 
             st.divider()
 
             if st.button("Clear Results", use_container_width=True):
-                del st.session_state['analysis_results']
-                if RESULTS_FILE.exists():
-                    RESULTS_FILE.unlink()
+                clear_analysis_results()
+                clear_saved_results()
                 st.rerun()
 
             # Filter Diagnostics Panel
@@ -171,54 +492,47 @@ def main():
                 cases = results.get('cases', [])
                 diagnostics = diagnose_filter(cases)
 
-                included = [d for d in diagnostics if d['status'] == 'INCLUDED']
-                excluded = [d for d in diagnostics if d['status'] == 'EXCLUDED']
+                # Bucket every diagnostic in a single pass
+                included, excluded, no_date_data, old_but_included = [], [], [], []
+                for d in diagnostics:
+                    days = d['days_since_last_message']
+                    if d['status'] == 'INCLUDED':
+                        included.append(d)
+                        if days is not None and days > RECENT_WINDOW_DAYS:
+                            old_but_included.append(d)
+                    else:
+                        excluded.append(d)
+                    if days is None:
+                        no_date_data.append(d)
 
                 st.write(f"**Recent Issues:** {len(included)} cases")
                 st.write(f"**Excluded:** {len(excluded)} cases")
 
                 # Show cases that might be problematic
-                no_date_data = [d for d in diagnostics if d['days_since_last_message'] is None]
                 if no_date_data:
                     st.warning(f"{len(no_date_data)} cases missing message date data")
                     for d in no_date_data[:3]:
                         st.caption(f"- {d['case_number']}: {d['reason']}")
 
-                old_but_included = [d for d in diagnostics
-                                    if d['days_since_last_message'] and d['days_since_last_message'] > RECENT_WINDOW_DAYS
-                                    and d['status'] == 'INCLUDED']
                 if old_but_included:
                     st.error(f"BUG: {len(old_but_included)} old cases incorrectly included!")
                     for d in old_but_included[:5]:
                         st.caption(f"- {d['case_number']}: {d['reason']}")
 
     # Main content area
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {COLORS['surface']} 0%, {COLORS['background']} 100%);
-                padding: 1.5rem; border-radius: 12px; margin-bottom: 1.5rem;
-                border: 1px solid {COLORS['border']}; border-left: 4px solid {COLORS['primary']};">
-        <h1 style="color: {COLORS['primary']}; margin: 0; font-size: 1.8rem;">Customer Sentiment Analyzer</h1>
-        <p style="color: {COLORS['text_muted']}; margin: 10px 0 0 0;">
-            Cache-first analysis with incremental updates
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(MAIN_HEADER_HTML)
 
-    # Initialize cache
-    cache = AnalysisCache(CACHE_FILE)
-    cache_stats = cache.get_cache_stats()
+    # Shared cache (loaded from disk once per process)
+    cache = get_cache(str(CACHE_FILE))
+    cache_version = _cache_version()
+    cache_stats = _cache_stats(cache_version)
 
     # Show cache status
     if cache_stats["total_cases"] > 0:
-        st.markdown(f"""
-        <div style="background: {COLORS['success_tint']}; padding: 0.75rem 1rem; border-radius: 6px;
-                    border: 1px solid {COLORS['success']}; margin-bottom: 1rem;">
-            <span style="color: {COLORS['success']};">&#128202; Cache: {cache_stats['open_cases']} open cases, {cache_stats['closed_cases']} closed</span>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(CACHE_BANNER_TEMPLATE.format_map(cache_stats))
 
     # Action selector
-    st.markdown(f"<h3 style='color: {COLORS['text']}'>Select Action</h3>", unsafe_allow_html=True)
+    st.html(SELECT_ACTION_HEADING_HTML)
 
     action = st.radio(
         "What would you like to do?",
@@ -236,6 +550,14 @@ def main():
                 # Convert cache to analysis results format
                 cases = cache.export_for_dashboard(include_closed=False)
 
+                # One pass for both the high-frustration count and the average
+                total_frust = 0
+                high_frust_count = 0
+                for c in cases:
+                    recent = c.get("recent_frustration_14d", 0)
+                    total_frust += recent
+                    high_frust_count += recent >= 7
+
                 # Build results structure compatible with existing dashboard
                 results = {
                     "cases": cases,
@@ -243,117 +565,38 @@ def main():
                     "source": "cache",
                     "statistics": {
                         "haiku": {
-                            "high_frustration": sum(1 for c in cases if c.get("recent_frustration_14d", 0) >= 7),
-                            "avg_frustration_score": sum(c.get("recent_frustration_14d", 0) for c in cases) / len(cases) if cases else 0
+                            "high_frustration": high_frust_count,
+                            "avg_frustration_score": total_frust / len(cases) if cases else 0
                         }
                     },
                     "timing": {"total_time": 0}
                 }
 
-                st.session_state['analysis_results'] = results
-                save_results(results)
+                set_analysis_results(_intern_case_labels(results))
+                save_results_in_background(results)
                 st.success(f"Loaded {len(cases)} cases from cache.")
                 st.rerun()
 
             # Show attention-needed cases
-            attention_cases = cache.get_cases_needing_attention(RECENT_WINDOW_DAYS)
+            attention_count, attention_cases = _attention_cases(cache_version, RECENT_WINDOW_DAYS)
             if attention_cases:
-                st.markdown(f"<h4 style='color: {COLORS['warning']}'>⚠️ Cases Needing Attention ({len(attention_cases)})</h4>", unsafe_allow_html=True)
-                for case in attention_cases[:5]:
+                st.html(ATTENTION_HEADING_TEMPLATE.format(count=attention_count))
+                for case in attention_cases:
                     metrics = case.get("calculated_metrics", {})
                     trend_icon = "📉" if metrics.get("trend") == "declining" else "📊"
-                    st.markdown(f"""
-                    <div style="background: {COLORS['surface']}; padding: 0.75rem; border-radius: 6px;
-                                border-left: 3px solid {COLORS['warning']}; margin-bottom: 0.5rem;">
-                        <strong style="color: {COLORS['text']};">{case.get('customer_name', 'Unknown')}</strong>
-                        <span style="color: {COLORS['text']};">- Case {case.get('case_number')}</span><br/>
-                        <span style="color: {COLORS['text_muted']};">
-                            {trend_icon} Recent frustration: {metrics.get('recent_frustration', 0)}/10 |
-                            Trend: {metrics.get('trend', 'stable')}
-                        </span>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.html(ATTENTION_ROW_TEMPLATE.format(
+                        customer_name=case.get('customer_name', 'Unknown'),
+                        case_number=case.get('case_number'),
+                        trend_icon=trend_icon,
+                        recent_frustration=metrics.get('recent_frustration', 0),
+                        trend=metrics.get('trend', 'stable'),
+                    ))
 
     elif action == "Upload Open Cases":
-        uploaded_file = st.file_uploader(
-            "Upload Excel file with open support cases",
-            type=["xlsx", "xls"],
-            help="Excel file with columns: Case Number, Customer Name, Message, Severity, Message Date"
-        )
-
-        if uploaded_file is not None:
-            st.success(f"Loaded: {uploaded_file.name}")
-
-            col1, col2 = st.columns(2)
-            with col1:
-                force_full = st.checkbox(
-                    "Force full re-analysis",
-                    help="Re-analyze all messages even if cached (rebuilds cache)"
-                )
-            with col2:
-                incremental = st.checkbox(
-                    "Incremental mode",
-                    value=True,
-                    help="Only analyze new messages (uses cached context)",
-                    disabled=force_full
-                )
-
-            if st.button("Run Analysis", type="primary", disabled=not api_key, use_container_width=True):
-                if not api_key:
-                    st.error("Please set ANTHROPIC_API_KEY in .env file.")
-                    return
-
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                def update_progress(message: str, progress: float):
-                    progress_bar.progress(progress)
-                    status_text.text(message)
-
-                try:
-                    with st.spinner("Initializing..."):
-                        analyzer = SentimentAnalyzer(
-                            api_key=api_key,
-                            progress_callback=update_progress
-                        )
-
-                    # Pass cache and mode to analyzer
-                    results = analyzer.analyze(
-                        file=uploaded_file.getvalue(),
-                        top_quick=top_quick,
-                        top_detailed=top_detailed,
-                        cache=cache if not force_full else None,
-                        incremental=incremental and not force_full
-                    )
-
-                    # Save updated cache
-                    cache.save_cache()
-
-                    progress_bar.empty()
-                    status_text.empty()
-
-                    st.session_state['analysis_results'] = results
-                    save_results(results)
-
-                    st.success(f"Analysis complete! Processed {results['total_cases']} cases.")
-                    st.rerun()
-
-                except Exception as e:
-                    progress_bar.empty()
-                    status_text.empty()
-                    st.error(f"Analysis failed: {str(e)}")
-                    st.exception(e)
+        upload_open_cases(api_key, cache, top_quick, top_detailed)
 
     elif action == "Upload Closed Cases":
-        st.markdown(f"""
-        <div style="background: {COLORS['surface']}; padding: 1rem; border-radius: 8px;
-                    border: 1px solid {COLORS['border']}; margin-bottom: 1rem;">
-            <p style="color: {COLORS['text_muted']}; margin: 0;">
-                Upload a report of closed cases to update their status in the cache.
-                Cases with status matching: {', '.join(CLOSED_STATUSES[:3])}... will be marked closed.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(CLOSED_UPLOAD_HINT_HTML)
 
         closed_file = st.file_uploader(
             "Upload Excel file with closed cases",
@@ -367,23 +610,20 @@ def main():
 
             if st.button("Update Closed Cases", type="primary", use_container_width=True):
                 try:
-                    import pandas as pd
                     from src.data_loader import DataLoader
 
                     # Load the closed cases file
                     loader = DataLoader()
-                    df = loader.load_excel(closed_file.getvalue())
+                    df, _ = loader.load_excel(closed_file.getvalue())
 
                     # Find case numbers with closed status (normalize for consistent matching)
-                    closed_case_numbers = []
-                    for _, row in df.iterrows():
-                        status = str(row.get("Status", "")).strip()
-                        case_num = normalize_case_number(row.get("Case Number", ""))
-                        if status in CLOSED_STATUSES and case_num:
-                            closed_case_numbers.append(case_num)
+                    unique_closed = []
+                    if "Status" in df.columns and "Case Number" in df.columns:
+                        mask = df["Status"].astype(str).str.strip().str.lower().isin(CLOSED_STATUSES_NORM)
+                        case_nums = df.loc[mask, "Case Number"].map(normalize_case_number)
+                        unique_closed = case_nums[case_nums.astype(bool)].unique().tolist()
 
                     # Update cache
-                    unique_closed = list(set(closed_case_numbers))
                     updated = cache.mark_cases_closed(unique_closed)
                     cache.save_cache()
 
@@ -394,59 +634,28 @@ def main():
                     st.exception(e)
 
     # Show results if available
-    if 'analysis_results' in st.session_state:
+    if results is not None:
         st.divider()
-        st.markdown(f"""
-        <div style="background: linear-gradient(135deg, {COLORS['surface']} 0%, {COLORS['background']} 100%);
-                    padding: 1rem; border-radius: 8px; margin-bottom: 1rem;
-                    border: 1px solid {COLORS['border']}; border-left: 4px solid {COLORS['success']};">
-            <h3 style="color: {COLORS['success']}; margin: 0;">✓ Results Ready</h3>
-            <p style="color: {COLORS['text_muted']}; margin: 5px 0 0 0;">
-                Use sidebar navigation: <strong style="color: {COLORS['text']};">Overview</strong>, <strong style="color: {COLORS['text']};">Cases</strong>,
-                <strong style="color: {COLORS['text']};">Timeline</strong>, <strong style="color: {COLORS['text']};">Trends</strong>, <strong style="color: {COLORS['text']};">Export</strong>
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(RESULTS_READY_HTML)
 
-        results = st.session_state['analysis_results']
-        stats = results.get("statistics", {}).get("haiku", {})
-        total_cases = results.get("total_cases", 0)
         high_frust = stats.get("high_frustration", 0)
         avg_frust = stats.get("avg_frustration_score", 0)
 
-        # Hero metrics for quick summary
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.markdown(f"""
-            <div class="hero-metric">
-                <div class="hero-metric-value" style="color: {COLORS['primary']};">{total_cases}</div>
-                <div class="hero-metric-label">Total Cases</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with col2:
-            high_color = COLORS['critical'] if high_frust > 0 else COLORS['success']
-            st.markdown(f"""
-            <div class="hero-metric" style="border-color: {high_color}; border-width: 2px;">
-                <div class="hero-metric-value" style="color: {high_color};">{high_frust}</div>
-                <div class="hero-metric-label">High Frustration</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with col3:
-            frust_color = COLORS['critical'] if avg_frust >= 7 else (COLORS['warning'] if avg_frust >= 4 else COLORS['success'])
-            st.markdown(f"""
-            <div class="hero-metric">
-                <div class="hero-metric-value" style="color: {frust_color};">{avg_frust:.1f}</div>
-                <div class="hero-metric-label">Avg Frustration /10</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with col4:
-            source = results.get("source", "analysis")
-            st.markdown(f"""
-            <div class="hero-metric">
-                <div class="hero-metric-value" style="color: {COLORS['text']}; font-size: 1.5rem;">{source.title()}</div>
-                <div class="hero-metric-label">Data Source</div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Hero metrics for quick summary: (value, label, value style, card style)
+        high_color = critical if high_frust > 0 else success
+        frust_color = critical if avg_frust >= 7 else (warning if avg_frust >= 4 else success)
+        source = results.get("source", "analysis")
+        hero_metrics = (
+            (total_cases, "Total Cases", f"color: {primary};", ""),
+            (high_frust, "High Frustration", f"color: {high_color};",
+             f' style="border-color: {high_color}; border-width: 2px;"'),
+            (f"{avg_frust:.1f}", "Avg Frustration /10", f"color: {frust_color};", ""),
+            (source.title(), "Data Source", f"color: {text}; font-size: 1.5rem;", ""),
+        )
+        for col, (value, label, value_style, card_style) in zip(st.columns(4), hero_metrics):
+            col.html(HERO_METRIC_TEMPLATE.format(
+                value=value, label=label, value_style=value_style, card_style=card_style
+            ))
 
 
 if __name__ == "__main__":
@@ -3,6 +3,11 @@ Configuration settings for Customer Sentiment Analyzer.
 Contains model names, scoring weights, and TrueNAS context.
 """
 
+from bisect import bisect_left, bisect_right
+from functools import cache, lru_cache
+from pathlib import Path
+from typing import Final
+
 # Model Configuration
 # Using current Anthropic model IDs
 MODELS = {
@@ -20,9 +25,9 @@ TOP_QUICK_SCORE = 25  # Cases for Stage 2A quick scoring
 TOP_DETAILED = 10     # Cases for Stage 2B detailed timeline
 
 # Three-Gate Architecture Thresholds
-GATE1_AVG_THRESHOLD = 3           # Avg frustration to trigger Gate 2 (Sonnet quick)
-GATE1_PEAK_THRESHOLD = 5          # Peak frustration to trigger Gate 2 (Sonnet quick)
-GATE2_CRITICALITY_THRESHOLD = 150 # Criticality score to trigger Gate 3 (timeline)
+GATE1_AVG_THRESHOLD: Final = 3           # Avg frustration to trigger Gate 2 (Sonnet quick)
+GATE1_PEAK_THRESHOLD: Final = 5          # Peak frustration to trigger Gate 2 (Sonnet quick)
+GATE2_CRITICALITY_THRESHOLD: Final = 150 # Criticality score to trigger Gate 3 (timeline)
 
 # Message Limits for API Calls
 TIMELINE_MESSAGE_LIMIT = 300000    # 300KB for timeline generation (was 150KB)
@@ -30,19 +35,22 @@ EXECUTIVE_SUMMARY_LIMIT = 25000    # 25KB for executive summary generation (was
 
 # Cache Configuration for Incremental Analysis
 CACHE_FILE = "data/analysis_cache.json"
-RECENT_WINDOW_DAYS = 14           # Days to consider as "recent" for trend analysis
-TREND_THRESHOLD = 1.5             # Score difference to flag as "declining" or "improving"
-HIGH_RECENT_FRUSTRATION = 7.0     # Minimum recent frustration to flag for attention
+RECENT_WINDOW_DAYS: Final = 14           # Days to consider as "recent" for trend analysis
+TREND_THRESHOLD: Final = 1.5             # Score difference to flag as "declining" or "improving"
+HIGH_RECENT_FRUSTRATION: Final = 7.0     # Minimum recent frustration to flag for attention
 
 # Closed Case Status Values (from Salesforce)
-CLOSED_STATUSES = [
+# Ordered tuple for display; frozensets for O(1) membership checks.
+CLOSED_STATUSES_DISPLAY = (
     "Closed",
     "Closed No Response",
     "Closed Duplicate",
     "Closed Spam",
     "Closed-Test",
-    "Closed-NA"
-]
+    "Closed-NA",
+)
+CLOSED_STATUSES = frozenset(CLOSED_STATUSES_DISPLAY)
+CLOSED_STATUSES_NORM = frozenset(s.lower().strip() for s in CLOSED_STATUSES_DISPLAY)
 
 
 def normalize_case_number(case_number) -> str:
@@ -52,6 +60,7 @@ def normalize_case_number(case_number) -> str:
     - Strips leading zeros
     - Handles int, float, and string inputs
     - Returns string for consistent dictionary keys
+    - None and NaN (empty pandas cells) return ""
 
     Examples:
         normalize_case_number("00090406") -> "90406"
@@ -59,17 +68,38 @@ def normalize_case_number(case_number) -> str:
         normalize_case_number(90406.0) -> "90406"
         normalize_case_number("  00090406  ") -> "90406"
     """
-    if case_number is None:
+    # Exact type checks: ints (and whole floats from pandas) skip the string path
+    t = type(case_number)
+    if t is int:
+        return str(case_number)
+    if t is float:
+        if case_number != case_number:  # NaN
+            return ""
+        # Beyond 1e16 str() switches to exponent notation; keep the old handling there
+        if case_number.is_integer() and abs(case_number) < 1e16:
+            return str(int(case_number))
+    elif case_number is None:
         return ""
-    # Convert to string, strip whitespace
-    case_str = str(case_number).strip()
+    return _normalize_case_str(str(case_number))
+
+
+@lru_cache(maxsize=8192)
+def _normalize_case_str(case_str: str) -> str:
+    """Cached body of normalize_case_number - the same raw keys recur across loads."""
+    # Strip whitespace
+    case_str = case_str.strip()
     # Remove any decimal part (e.g., "90406.0" from pandas)
     if '.' in case_str:
-        case_str = case_str.split('.')[0]
+        case_str = case_str[:case_str.index('.')]
     # Strip leading zeros, but keep at least one digit
     return case_str.lstrip('0') or '0'
 
 
+def clear_case_number_cache() -> None:
+    """Drop the memoized normalize_case_number results."""
+    _normalize_case_str.cache_clear()
+
+
 # Scoring Weights
 SEVERITY_WEIGHTS = {
     "S1": 35,
@@ -78,6 +108,10 @@ SEVERITY_WEIGHTS = {
     "S4": 5,
 }
 
+# Severity ordering (1 = most severe) and the levels treated as high severity
+SEVERITY_RANK = {"S1": 1, "S2": 2, "S3": 3, "S4": 4}
+HIGH_SEVERITY = frozenset(sev for sev, rank in SEVERITY_RANK.items() if rank <= 2)
+
 ISSUE_CLASS_WEIGHTS = {
     "Systemic": 30,
     "Environmental": 15,
@@ -100,107 +134,94 @@ SUPPORT_LEVEL_WEIGHTS = {
     "Unknown": 0,
 }
 
+# Point ladders as (thresholds, points) tables - one bisect per call instead of
+# walking an if/elif chain. points[i] applies between thresholds[i-1] and thresholds[i].
+# Missing inputs (None/NaN) keep what the old if/elif ladders returned for NaN, where
+# every comparison is False: the final else branch (*_MISSING_POINTS below).
+
 # Message Volume Scoring (more messages = prolonged issue = higher priority)
+VOLUME_THRESHOLDS = (5, 10, 20)          # upper bounds, inclusive
+VOLUME_POINTS = (5, 10, 20, 30)
+VOLUME_MISSING_POINTS = VOLUME_POINTS[-1]
+
 def get_volume_points(msg_count: int) -> int:
     """Return points based on message count (more = higher priority)."""
-    if msg_count <= 5:
-        return 5
-    elif msg_count <= 10:
-        return 10
-    elif msg_count <= 20:
-        return 20
-    else:
-        return 30
+    if msg_count is None or msg_count != msg_count:  # None / NaN
+        return VOLUME_MISSING_POINTS
+    return VOLUME_POINTS[bisect_left(VOLUME_THRESHOLDS, msg_count)]
 
 # Case Age Scoring (longer = higher priority)
+AGE_THRESHOLDS = (14, 30, 60, 90)        # lower bounds, inclusive
+AGE_POINTS = (0, 3, 5, 7, 10)
+AGE_MISSING_POINTS = AGE_POINTS[0]
+
 def get_age_points(days: int) -> int:
     """Return points based on case age in days."""
-    if days >= 90:
-        return 10
-    elif days >= 60:
-        return 7
-    elif days >= 30:
-        return 5
-    elif days >= 14:
-        return 3
-    else:
-        return 0
+    if days is None or days != days:  # None / NaN
+        return AGE_MISSING_POINTS
+    return AGE_POINTS[bisect_right(AGE_THRESHOLDS, days)]
 
 # Engagement Scoring (graduated scale)
+ENGAGEMENT_THRESHOLDS = (0.3, 0.5, 0.7)  # lower bounds, inclusive
+ENGAGEMENT_POINTS_SCALE = (0, 5, 10, 15)
+ENGAGEMENT_MISSING_POINTS = ENGAGEMENT_POINTS_SCALE[0]
+
 def get_engagement_points(engagement_ratio: float) -> int:
     """Return points based on customer engagement ratio."""
-    if engagement_ratio >= 0.7:
-        return 15
-    elif engagement_ratio >= 0.5:
-        return 10
-    elif engagement_ratio >= 0.3:
-        return 5
-    else:
-        return 0
+    if engagement_ratio is None or engagement_ratio != engagement_ratio:  # None / NaN
+        return ENGAGEMENT_MISSING_POINTS
+    return ENGAGEMENT_POINTS_SCALE[bisect_right(ENGAGEMENT_THRESHOLDS, engagement_ratio)]
+
+# Vectorized variants for bulk scoring - the same tables, one np.searchsorted
+# pass over an array of cases. numpy is imported lazily to keep config light.
+def _ladder_points_array(values, thresholds, points, side: str, missing: int):
+    import numpy as np
+    values = np.asarray(values, dtype=np.float64)  # None -> NaN
+    idx = np.searchsorted(np.asarray(thresholds), values, side=side)
+    result = np.asarray(points, dtype=np.int32)[idx]
+    result[np.isnan(values)] = missing
+    return result
+
+def get_volume_points_array(msg_counts):
+    """Vectorized get_volume_points over an array-like of message counts."""
+    return _ladder_points_array(msg_counts, VOLUME_THRESHOLDS, VOLUME_POINTS, "left",
+                                VOLUME_MISSING_POINTS)
+
+def get_age_points_array(days):
+    """Vectorized get_age_points over an array-like of case ages in days."""
+    return _ladder_points_array(days, AGE_THRESHOLDS, AGE_POINTS, "right", AGE_MISSING_POINTS)
+
+def get_engagement_points_array(engagement_ratios):
+    """Vectorized get_engagement_points over an array-like of engagement ratios."""
+    return _ladder_points_array(engagement_ratios, ENGAGEMENT_THRESHOLDS, ENGAGEMENT_POINTS_SCALE, "right",
+                                ENGAGEMENT_MISSING_POINTS)
 
 # Engagement Threshold (legacy - use get_engagement_points instead)
 ENGAGEMENT_THRESHOLD = 0.6
 ENGAGEMENT_POINTS = 15
 
 # Frustration Level Thresholds
-FRUSTRATION_HIGH = 7
-FRUSTRATION_MEDIUM = 4
-FRUSTRATION_LOW = 1
+FRUSTRATION_HIGH: Final = 7
+FRUSTRATION_MEDIUM: Final = 4
+FRUSTRATION_LOW: Final = 1
 
 # TrueNAS Context for AI Analysis
-TRUENAS_CONTEXT = """
-COMPANY & PRODUCT CONTEXT:
-TrueNAS is an enterprise open-source storage company serving Fortune 500 customers globally.
-Products: TrueNAS F-Series (high-performance NVMe), M-Series (high-capacity all-flash/hybrid),
-H-Series (versatile & power-efficient), R-Series (single controller appliance).
-Technology: ZFS file system, self-healing architecture, unified storage for virtualization and backup.
-
-SUPPORT TIER CONTEXT:
-- Gold Support: 24x7 for S1/S2, 4-hour on-site response, proactive monitoring
-- Silver Support: 24x5 for S1/S2, next business day on-site response
-- Bronze Support: 12x5 business hours, email support, next business day parts
-
-SEVERITY LEVEL DEFINITIONS:
-- S1: System not serving data OR severe performance degradation critically disrupting business operations
-  → CRITICAL: Production down, data inaccessible, business impact
-  → SLA: 2-hour response, 24x7 (Gold/Silver)
-
-- S2: Performance degradation in production OR intermittent faults affecting operations
-  → HIGH: System functional but degraded, impacting productivity
-  → SLA: 4-hour response, 24x7 (Gold), 24x5 (Silver)
-
-- S3: Issue or defect causing minimal business impact
-  → MEDIUM: Minor problems, workarounds available
-  → SLA: 4-hour email response during business hours
-
-- S4: Information requests or administrative questions
-  → LOW: General inquiries, how-to questions
-  → SLA: Next business day response
-
-CUSTOMER PROFILE:
-Enterprise B2B customers with mission-critical storage needs. Customers expect:
-- Fast response for production issues (S1/S2)
-- Expert technical knowledge of ZFS, storage, and enterprise infrastructure
-- Professional communication with minimal back-and-forth
-- Clear escalation paths and regular updates
-- Hardware replacement within SLA commitments
-
-COMMON ISSUES TO RECOGNIZE:
-- Storage performance problems (IOPS, latency, throughput)
-- Data integrity concerns (scrub errors, disk failures)
-- Replication/backup issues affecting disaster recovery
-- Hardware failures (drives, controllers, power supplies)
-- Software upgrade complications
-- Network connectivity or configuration issues
-
-CHURN RISK INDICATORS:
-- Threats to switch to competitors (NetApp, Dell EMC, Pure Storage)
-- Mentions of contract renewal concerns
-- Executive escalation requests
-- Repeated issues without resolution
-- SLA violations or missed commitments
-- Loss of trust in product or support team
-"""
+# Kept in a sidecar text file and only read the first time a prompt needs it
+TRUENAS_CONTEXT_FILE = Path(__file__).with_name("truenas_context.txt")
+
+
+@cache
+def get_truenas_context() -> str:
+    """Return the domain context sent with every analysis prompt."""
+    return TRUENAS_CONTEXT_FILE.read_text(encoding="utf-8").strip()
+
+
+def __getattr__(name):
+    # Deprecated: TRUENAS_CONTEXT used to be a module-level literal
+    if name == "TRUENAS_CONTEXT":
+        return get_truenas_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Column Mapping Configuration
 COLUMN_MAPPINGS = {
@@ -222,6 +243,19 @@ COLUMN_MAPPINGS = {
                       "age_days", "agedays", "case age", "case_age"],
 }
 
+# Reverse index built once at import: alias -> canonical name, plus each alias's
+# position in its list so the earliest-listed alias still wins when a sheet has several.
+ALIAS_TO_CANONICAL = {
+    alias.lower().strip(): canonical
+    for canonical, aliases in COLUMN_MAPPINGS.items()
+    for alias in aliases
+}
+ALIAS_RANK = {
+    alias.lower().strip(): rank
+    for aliases in COLUMN_MAPPINGS.values()
+    for rank, alias in enumerate(aliases)
+}
+
 # Required columns (must be present)
 REQUIRED_COLUMNS = ["case number", "customer name", "message", "severity"]
 
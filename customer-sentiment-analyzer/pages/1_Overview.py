@@ -2,17 +2,92 @@
 Overview Page - Open Case Analysis with actionable insights.
 """
 
+import heapq
+import re
 import streamlit as st
-import plotly.graph_objects as go
-from collections import Counter
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
 
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.dashboard.branding import COLORS, get_frustration_color
+from config.settings import FRUSTRATION_HIGH, HIGH_SEVERITY, RECENT_WINDOW_DAYS
+from src.dashboard.branding import COLORS, SIDEBAR_HEADER_HTML, get_frustration_colors
 from src.dashboard.styles import get_global_css, apply_plotly_theme
-from src.dashboard.filters import get_filtered_cases, get_view_mode_indicator_html
+from src.dashboard.filters import get_view_mode_indicator_html
+from src.dashboard.session import get_results_token, get_view_cases
+
+# Sentiment-trend keywords, compiled once; case-insensitive so trends need no .lower()
+DETERIORATING_RE = re.compile(r"negative|worsening|declining|deteriorat", re.I)
+IMPROVING_RE = re.compile(r"positive|improving|better", re.I)
+ESCALATING_RE = re.compile(r"negative|worsening|declining", re.I)
+
+# Row templates with the constant palette baked in; only per-row fields are formatted
+HOTSPOT_ROW_TPL = f"""
+            <div style="background: {COLORS['background']}; padding: 1rem; border-radius: 8px;
+                        border: 1px solid {COLORS['border']}; margin-bottom: 0.5rem;
+                        border-left: 4px solid {{frust_color}};">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <strong style="color: {COLORS['text']};">{{customer}}</strong>
+                        <span style="color: {COLORS['text_muted']}; margin-left: 1rem;">Cases: {{case_nums}}</span>
+                    </div>
+                    <div>
+                        <span style="background: {{frust_color}}; color: white; padding: 4px 12px;
+                                     border-radius: 20px; font-weight: bold;">
+                            {{count}} cases | Avg: {{avg_frust:.1f}}/10
+                        </span>
+                    </div>
+                </div>
+            </div>
+            """
+
+ESCALATION_ROW_TPL = f"""
+            <div style="background: {COLORS['background']}; padding: 1rem; border-radius: 8px;
+                        border: 1px solid {COLORS['border']}; margin-bottom: 0.5rem;
+                        border-left: 4px solid {{frust_color}};">
+                <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                    <div style="flex: 1;">
+                        <strong style="color: {COLORS['text']};">Case {{case_number}}</strong>
+                        <span style="color: {COLORS['text_muted']}; margin-left: 1rem;">{{customer}}</span>
+                        <p style="color: {COLORS['warning']}; margin: 5px 0 0 0; font-size: 0.9rem;">{{reason}}</p>
+                        {{key_phrase_html}}
+                    </div>
+                    <span style="background: {{frust_color}}; color: white; padding: 4px 12px;
+                                 border-radius: 20px; font-weight: bold; white-space: nowrap;">
+                        {{frustration}}/10
+                    </span>
+                </div>
+            </div>
+            """
+
+KEY_PHRASE_TPL = f'<p style="color: {COLORS["text_muted"]}; margin: 5px 0 0 0; font-style: italic; font-size: 0.85rem;">"{{key_phrase}}..."</p>'
+
+# Pie slice palettes for the distribution charts
+SEVERITY_PIE_COLORS = (COLORS['critical'], COLORS['warning'], COLORS['secondary'], COLORS['text_muted'])
+SUPPORT_PIE_COLORS = (COLORS['warning'], COLORS['secondary'], COLORS['text_muted'], COLORS['border'])
+
+# Shared read-only stand-in for a missing analysis block
+_NO_ANALYSIS = MappingProxyType({})
+
+
+def _claude(case: dict):
+    """Return a case's claude_analysis, or an empty mapping when missing or null."""
+    return case.get("claude_analysis") or _NO_ANALYSIS
+
+
+def _deepseek(case: dict):
+    """Return a case's deepseek_analysis, or an empty mapping when missing or null."""
+    return case.get("deepseek_analysis") or _NO_ANALYSIS
+
+
+def _frust(case: dict):
+    """Return a case's frustration score, 0 when it has no analysis."""
+    analysis = case.get("claude_analysis")
+    return analysis.get("frustration_score", 0) if analysis else 0
 
 
 def render_metric_detail_panel(title: str, cases: list, color: str):
@@ -32,11 +107,10 @@ def render_metric_detail_panel(title: str, cases: list, color: str):
     # Create a mini dataframe for display
     display_data = []
     for case in cases[:10]:  # Limit to top 10
-        claude = case.get("claude_analysis") or {}
         display_data.append({
             "Case #": case.get("case_number", "?"),
             "Customer": case.get("customer_name", "Unknown")[:25],
-            "Frustration": f"{claude.get('frustration_score', 0)}/10",
+            "Frustration": f"{_frust(case)}/10",
             "Severity": case.get("severity", "?"),
             "Days Open": case.get("case_age_days", 0),
         })
@@ -62,11 +136,7 @@ st.markdown(get_global_css(), unsafe_allow_html=True)
 
 # Sidebar with view mode toggle
 with st.sidebar:
-    st.markdown(f"""
-    <div style="text-align: center; padding: 0.5rem 0; border-bottom: 1px solid {COLORS['border']}; margin-bottom: 0.75rem;">
-        <h3 style="color: {COLORS['primary']}; margin: 0;">Customer Sentiment</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(SIDEBAR_HEADER_HTML)
 
     # View Mode Toggle - synced across all pages via session state
     if 'view_mode' not in st.session_state:
@@ -87,20 +157,40 @@ with st.sidebar:
 
 def get_case_status(case: dict) -> str:
     """Determine if case is improving, deteriorating, or stable."""
-    deepseek = case.get("deepseek_analysis") or {}
-    claude = case.get("claude_analysis") or {}
+    return status_from_signals(
+        _deepseek(case).get("sentiment_trend", ""),
+        _claude(case).get("resolution_outlook", "").lower()
+    )
+
+
+def _topk_with_other(counts: dict, k: int = 10) -> dict:
+    """Keep the k largest categories of a distribution and fold the rest into "Other".
+
+    Distributions with k or fewer categories are returned unchanged.
+    """
+    if len(counts) <= k:
+        return counts
+    top = heapq.nlargest(k, counts.items(), key=lambda kv: kv[1])
+    kept = dict(top)
+    kept["Other"] = kept.get("Other", 0) + sum(v for key, v in counts.items() if key not in kept)
+    return kept
+
 
-    sentiment_trend = deepseek.get("sentiment_trend", "").lower()
-    resolution = claude.get("resolution_outlook", "").lower()
+@lru_cache(maxsize=256)
+def status_from_signals(sentiment_trend: str, resolution: str) -> str:
+    """Classify a case from its sentiment trend and lowercased resolution outlook.
 
+    Both inputs come from a small vocabulary of model outputs, so results are
+    memoized and repeated combinations skip the regex scans.
+    """
     # Check for deteriorating signals
-    if any(word in sentiment_trend for word in ["negative", "worsening", "declining", "deteriorat"]):
+    if DETERIORATING_RE.search(sentiment_trend):
         return "deteriorating"
     if resolution in ["negative", "stalled"]:
         return "deteriorating"
 
     # Check for improving signals
-    if any(word in sentiment_trend for word in ["positive", "improving", "better"]):
+    if IMPROVING_RE.search(sentiment_trend):
         return "improving"
     if resolution == "positive":
         return "improving"
@@ -108,6 +198,182 @@ def get_case_status(case: dict) -> str:
     return "stable"
 
 
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def compute_overview_aggregates(signals: tuple) -> dict:
+    """Classify cases from their extracted signals.
+
+    Args:
+        signals: One (frustration, severity, sentiment_trend, resolution_outlook,
+            customer_name, case_age_days, criticality_score) tuple per case, with
+            the resolution outlook lowercased
+
+    Returns:
+        Dictionary of index lists into the case list, the top customer
+        hotspots as (customer, indices, avg_frustration), the top
+        (index, reason, frustration) escalations and the critical-score count
+    """
+    import numpy as np
+
+    # Numeric tests run as vectorized masks over parallel arrays (one per field)
+    n = len(signals)
+    frustration = np.fromiter((sig[0] for sig in signals), dtype=np.float64, count=n)
+    high_severity = np.fromiter((sig[1] in HIGH_SEVERITY for sig in signals), dtype=bool, count=n)
+    age = np.fromiter((sig[5] for sig in signals), dtype=np.float64, count=n)
+    criticality = np.fromiter((sig[6] for sig in signals), dtype=np.float64, count=n)
+
+    # Needs attention: high frustration OR S1/S2 severity
+    high_frustration = frustration >= FRUSTRATION_HIGH
+    needs_attention = np.flatnonzero(high_frustration | high_severity).tolist()
+    critical_count = int(np.count_nonzero(criticality >= 180))
+    recent_high = (high_frustration & (age <= RECENT_WINDOW_DAYS)).tolist()
+    very_high = (frustration >= 8).tolist()
+
+    # String signals still need a per-case pass
+    improving = []
+    deteriorating = []
+    customer_cases = defaultdict(list)
+    escalations = []
+
+    # Bind globals and bound methods to locals once for the per-case loop
+    classify = status_from_signals
+    escalating = ESCALATING_RE.search
+    add_escalation = escalations.append
+
+    for i, (frust, _, sentiment, resolution, customer, _, _) in enumerate(signals):
+        status = classify(sentiment, resolution)
+        if status == "deteriorating":
+            deteriorating.append(i)
+        elif status == "improving":
+            improving.append(i)
+
+        # Group cases by customer
+        customer_cases[customer].append(i)
+
+        # Escalation signals: high frustration + recent, OR negative sentiment trend
+        if recent_high[i]:
+            add_escalation((i, f"High frustration ({frust}/10) on recent case", frust))
+        elif escalating(sentiment):
+            add_escalation((i, "Negative sentiment trend", frust))
+        elif very_high[i]:
+            add_escalation((i, f"Very high frustration ({frust}/10)", frust))
+
+    # Customers with 2+ cases, top 5 by case count
+    hotspots = heapq.nlargest(
+        5,
+        ((customer, indices) for customer, indices in customer_cases.items() if len(indices) >= 2),
+        key=lambda x: len(x[1])
+    )
+
+    return {
+        "needs_attention": needs_attention,
+        "improving": improving,
+        "deteriorating": deteriorating,
+        "hotspots": [
+            (customer, indices, float(frustration[indices].mean()))
+            for customer, indices in hotspots
+        ],
+        # Top 8 by frustration score - partial sort, equivalent to sorted(...)[:8]
+        "top_escalations": heapq.nlargest(8, escalations, key=itemgetter(2)),
+        "critical_count": critical_count,
+    }
+
+
+def build_hotspots_card(hotspots: list, cases: list) -> str:
+    """Build the Customer Hotspots content card as one HTML string.
+
+    Card header, rows and closing tag go out as one element so the card wraps its rows.
+    """
+    rows = [f"""
+    <div class="content-card">
+        <div class="content-card-header">🔥 Customer Hotspots</div>
+        <p style="color: {COLORS['text_muted']}; font-size: 0.9rem; margin-bottom: 1rem;">
+            Customers with multiple open cases may have systemic issues
+        </p>
+    """]
+
+    if hotspots:
+        frust_colors = get_frustration_colors([avg_frust for _, _, avg_frust in hotspots])
+        for (customer, indices, avg_frust), frust_color in zip(hotspots, frust_colors):
+            rows.append(HOTSPOT_ROW_TPL.format(
+                frust_color=frust_color,
+                customer=customer,
+                case_nums=", ".join(map(str, (cases[i].get("case_number", "?") for i in indices))),
+                count=len(indices),
+                avg_frust=avg_frust,
+            ))
+    else:
+        rows.append(f"""
+        <p style="color: {COLORS['text_muted']}; text-align: center; padding: 1rem;">
+            No customers with multiple open cases
+        </p>
+        """)
+
+    rows.append("</div>")  # Close content-card
+    return "\n".join(rows)
+
+
+def build_escalations_card(top_escalations: list, cases: list) -> str:
+    """Build the Escalation Signals content card as one HTML string."""
+    rows = [f"""
+    <div class="content-card">
+        <div class="content-card-header">⚠️ Escalation Signals</div>
+        <p style="color: {COLORS['text_muted']}; font-size: 0.9rem; margin-bottom: 1rem;">
+            Cases showing signs of customer frustration or negative trends
+        </p>
+    """]
+
+    if top_escalations:
+        frust_colors = get_frustration_colors([frust for _, _, frust in top_escalations])
+        for (i, reason, frustration), frust_color in zip(top_escalations, frust_colors):
+            case = cases[i]
+            key_phrase = _claude(case).get("key_phrase", "")
+
+            rows.append(ESCALATION_ROW_TPL.format(
+                frust_color=frust_color,
+                case_number=case.get('case_number'),
+                customer=case.get('customer_name', 'Unknown')[:30],
+                reason=reason,
+                key_phrase_html=KEY_PHRASE_TPL.format(key_phrase=key_phrase[:100]) if key_phrase else '',
+                frustration=frustration,
+            ))
+    else:
+        rows.append(f"""
+        <p style="color: {COLORS['success']}; text-align: center; padding: 1rem;">
+            ✓ No escalation signals detected
+        </p>
+        """)
+
+    rows.append("</div>")  # Close content-card
+    return "\n".join(rows)
+
+
+# plotly.graph_objects is imported only here, on the first chart drawn, so
+# reruns without distributions to show never pay for the import.
+@st.cache_resource(show_spinner=False)
+def get_chart_templates() -> dict:
+    """Build the themed pie and bar figures once; charts copy them and fill in data."""
+    import plotly.graph_objects as go
+
+    pie = apply_plotly_theme(go.Figure(data=[go.Pie(
+        hole=0.4,
+        textfont=dict(color=COLORS['text'], size=12),
+        textinfo='label+percent',
+        insidetextorientation='radial'
+    )]))
+    pie.update_layout(height=350, showlegend=True)
+
+    bar = apply_plotly_theme(go.Figure(data=[go.Bar()]))
+    bar.update_layout(height=350)
+
+    return {"pie": pie, "bar": bar}
+
+
+def new_chart(kind: str):
+    """Return a fresh copy of the "pie" or "bar" template, ready for data."""
+    template = get_chart_templates()[kind]
+    return type(template)(template)  # go.Figure(fig) copy, without re-importing plotly
+
+
 def main():
     # Initialize session state for metric selection
     if 'selected_metric' not in st.session_state:
@@ -121,11 +387,10 @@ def main():
         return
 
     results = st.session_state['analysis_results']
-    cases = results.get("cases", [])
 
     # Apply view mode filter
     view_mode = st.session_state.get('view_mode', 'All Cases')
-    cases = get_filtered_cases(cases, view_mode)
+    cases = get_view_cases(view_mode)
 
     # Show view mode indicator
     indicator_html = get_view_mode_indicator_html(view_mode, len(cases), COLORS)
@@ -148,25 +413,29 @@ def main():
     stats = results.get("statistics", {})
     haiku_stats = stats.get("haiku", {})
 
-    # Calculate case statuses
-    needs_attention = []
-    improving = []
-    deteriorating = []
-
+    # Extract the fields the aggregates need in one pass, then classify through
+    # the cached summarizer - reruns with the same cases skip the classification.
+    # Numeric fields feed float arrays, so nulls are coerced here: a missing score
+    # counts as 0 and a missing age as NaN (never "recent").
+    signals = []
     for case in cases:
-        claude = case.get("claude_analysis") or {}
-        frustration = claude.get("frustration_score", 0)
-        severity = case.get("severity", "S4")
-        status = get_case_status(case)
-
-        if status == "deteriorating":
-            deteriorating.append(case)
-        elif status == "improving":
-            improving.append(case)
-
-        # Needs attention: high frustration OR S1/S2 severity
-        if frustration >= 7 or severity in ["S1", "S2"]:
-            needs_attention.append(case)
+        claude = _claude(case)
+        age = case.get("case_age_days", 0)
+        signals.append((
+            claude.get("frustration_score") or 0,
+            case.get("severity", "S4"),
+            _deepseek(case).get("sentiment_trend", ""),
+            claude.get("resolution_outlook", "").lower(),
+            case.get("customer_name", "Unknown"),
+            float("nan") if age is None else age,
+            case.get("criticality_score") or 0,
+        ))
+    aggregates = compute_overview_aggregates(tuple(signals))
+
+    needs_attention = [cases[i] for i in aggregates["needs_attention"]]
+    improving = [cases[i] for i in aggregates["improving"]]
+    deteriorating = [cases[i] for i in aggregates["deteriorating"]]
+    critical_count = aggregates["critical_count"]
 
     avg_frust = haiku_stats.get("avg_frustration_score", 0)
 
@@ -259,135 +528,21 @@ def main():
 
     st.divider()
 
-    # === CUSTOMER HOTSPOTS === (wrapped in content card)
-    st.markdown(f"""
-    <div class="content-card">
-        <div class="content-card-header">🔥 Customer Hotspots</div>
-        <p style="color: {COLORS['text_muted']}; font-size: 0.9rem; margin-bottom: 1rem;">
-            Customers with multiple open cases may have systemic issues
-        </p>
-    """, unsafe_allow_html=True)
-
-    # Group cases by customer
-    customer_cases = {}
-    for case in cases:
-        customer = case.get("customer_name", "Unknown")
-        if customer not in customer_cases:
-            customer_cases[customer] = []
-        customer_cases[customer].append(case)
-
-    # Find customers with 2+ cases
-    hotspots = [(customer, cases_list) for customer, cases_list in customer_cases.items() if len(cases_list) >= 2]
-    hotspots.sort(key=lambda x: len(x[1]), reverse=True)
-
-    if hotspots:
-        for customer, customer_case_list in hotspots[:5]:  # Top 5
-            total_frustration = sum(
-                (c.get("claude_analysis") or {}).get("frustration_score", 0)
-                for c in customer_case_list
-            )
-            avg_frust = total_frustration / len(customer_case_list)
-            frust_color = get_frustration_color(avg_frust)
-
-            case_nums = ", ".join([str(c.get("case_number", "?")) for c in customer_case_list])
-
-            st.markdown(f"""
-            <div style="background: {COLORS['background']}; padding: 1rem; border-radius: 8px;
-                        border: 1px solid {COLORS['border']}; margin-bottom: 0.5rem;
-                        border-left: 4px solid {frust_color};">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <strong style="color: {COLORS['text']};">{customer}</strong>
-                        <span style="color: {COLORS['text_muted']}; margin-left: 1rem;">Cases: {case_nums}</span>
-                    </div>
-                    <div>
-                        <span style="background: {frust_color}; color: white; padding: 4px 12px;
-                                     border-radius: 20px; font-weight: bold;">
-                            {len(customer_case_list)} cases | Avg: {avg_frust:.1f}/10
-                        </span>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
-        <p style="color: {COLORS['text_muted']}; text-align: center; padding: 1rem;">
-            No customers with multiple open cases
-        </p>
-        """, unsafe_allow_html=True)
-
-    st.markdown("</div>", unsafe_allow_html=True)  # Close content-card
-
-    # === RECENT ESCALATION SIGNALS === (wrapped in content card)
-    st.markdown(f"""
-    <div class="content-card">
-        <div class="content-card-header">⚠️ Escalation Signals</div>
-        <p style="color: {COLORS['text_muted']}; font-size: 0.9rem; margin-bottom: 1rem;">
-            Cases showing signs of customer frustration or negative trends
-        </p>
-    """, unsafe_allow_html=True)
-
-    escalation_cases = []
-    for case in cases:
-        claude = case.get("claude_analysis") or {}
-        deepseek = case.get("deepseek_analysis") or {}
-        frustration = claude.get("frustration_score", 0)
-        age = case.get("case_age_days", 0)
-        sentiment = deepseek.get("sentiment_trend", "")
-
-        # Escalation signals: high frustration + recent, OR negative sentiment trend
-        is_escalating = False
-        reason = ""
-
-        if frustration >= 7 and age <= 14:
-            is_escalating = True
-            reason = f"High frustration ({frustration}/10) on recent case"
-        elif any(word in sentiment.lower() for word in ["negative", "worsening", "declining"]):
-            is_escalating = True
-            reason = f"Negative sentiment trend"
-        elif frustration >= 8:
-            is_escalating = True
-            reason = f"Very high frustration ({frustration}/10)"
-
-        if is_escalating:
-            escalation_cases.append((case, reason))
-
-    # Sort by frustration score
-    escalation_cases.sort(key=lambda x: (x[0].get("claude_analysis") or {}).get("frustration_score", 0), reverse=True)
-
-    if escalation_cases:
-        for case, reason in escalation_cases[:8]:  # Top 8
-            claude = case.get("claude_analysis") or {}
-            frustration = claude.get("frustration_score", 0)
-            frust_color = get_frustration_color(frustration)
-            key_phrase = claude.get("key_phrase", "")
-
-            st.markdown(f"""
-            <div style="background: {COLORS['background']}; padding: 1rem; border-radius: 8px;
-                        border: 1px solid {COLORS['border']}; margin-bottom: 0.5rem;
-                        border-left: 4px solid {frust_color};">
-                <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-                    <div style="flex: 1;">
-                        <strong style="color: {COLORS['text']};">Case {case.get('case_number')}</strong>
-                        <span style="color: {COLORS['text_muted']}; margin-left: 1rem;">{case.get('customer_name', 'Unknown')[:30]}</span>
-                        <p style="color: {COLORS['warning']}; margin: 5px 0 0 0; font-size: 0.9rem;">{reason}</p>
-                        {f'<p style="color: {COLORS["text_muted"]}; margin: 5px 0 0 0; font-style: italic; font-size: 0.85rem;">"{key_phrase[:100]}..."</p>' if key_phrase else ''}
-                    </div>
-                    <span style="background: {frust_color}; color: white; padding: 4px 12px;
-                                 border-radius: 20px; font-weight: bold; white-space: nowrap;">
-                        {frustration}/10
-                    </span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-    else:
-        st.markdown(f"""
-        <p style="color: {COLORS['success']}; text-align: center; padding: 1rem;">
-            ✓ No escalation signals detected
-        </p>
-        """, unsafe_allow_html=True)
-
-    st.markdown("</div>", unsafe_allow_html=True)  # Close content-card
+    # === CUSTOMER HOTSPOTS / RECENT ESCALATION SIGNALS === (each wrapped in a content card)
+    # The card HTML only depends on the results and view mode, so reruns triggered by
+    # other widgets reuse the strings kept in session state instead of rebuilding them
+    token = get_results_token()
+    cards = st.session_state.get('_overview_cards')
+    if cards is None or cards[0] != token or cards[1] != view_mode:
+        cards = (
+            token,
+            view_mode,
+            build_hotspots_card(aggregates["hotspots"], cases),
+            build_escalations_card(aggregates["top_escalations"], cases),
+        )
+        st.session_state['_overview_cards'] = cards
+    st.html(cards[2])
+    st.html(cards[3])
 
     # === KEY METRICS ROW ===
     st.markdown(f"""
@@ -402,8 +557,7 @@ def main():
         high_frust = haiku_stats.get("high_frustration", 0)
         st.metric("High Frustration Cases", high_frust)
     with m3:
-        critical = len([c for c in cases if c.get("criticality_score", 0) >= 180])
-        st.metric("Critical Score Cases", critical)
+        st.metric("Critical Score Cases", critical_count)
     with m4:
         msg_count = haiku_stats.get("total_messages_analyzed", 0)
         st.metric("Messages Analyzed", msg_count)
@@ -427,17 +581,12 @@ def main():
         st.markdown(f"<h4 style='color: {COLORS['text']}'>Severity Distribution</h4>", unsafe_allow_html=True)
         severity_dist = distributions.get("severity", {})
         if severity_dist:
-            fig = go.Figure(data=[go.Pie(
+            fig = new_chart("pie")
+            fig.update_traces(
                 labels=list(severity_dist.keys()),
                 values=list(severity_dist.values()),
-                hole=0.4,
-                marker_colors=[COLORS['critical'], COLORS['warning'], COLORS['secondary'], COLORS['text_muted']],
-                textfont=dict(color=COLORS['text'], size=12),
-                textinfo='label+percent',
-                insidetextorientation='radial'
-            )])
-            fig = apply_plotly_theme(fig)
-            fig.update_layout(height=350, showlegend=True)
+                marker_colors=SEVERITY_PIE_COLORS
+            )
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No severity distribution data available")
@@ -446,17 +595,12 @@ def main():
         st.markdown(f"<h4 style='color: {COLORS['text']}'>Support Level Distribution</h4>", unsafe_allow_html=True)
         support_dist = distributions.get("support_level", {})
         if support_dist:
-            fig = go.Figure(data=[go.Pie(
+            fig = new_chart("pie")
+            fig.update_traces(
                 labels=list(support_dist.keys()),
                 values=list(support_dist.values()),
-                hole=0.4,
-                marker_colors=[COLORS['warning'], COLORS['secondary'], COLORS['text_muted'], COLORS['border']],
-                textfont=dict(color=COLORS['text'], size=12),
-                textinfo='label+percent',
-                insidetextorientation='radial'
-            )])
-            fig = apply_plotly_theme(fig)
-            fig.update_layout(height=350, showlegend=True)
+                marker_colors=SUPPORT_PIE_COLORS
+            )
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No support level distribution data available")
@@ -465,29 +609,27 @@ def main():
     col1, col2 = st.columns(2)
 
     with col1:
-        issue_classes = distributions.get("issue_classes", {})
+        issue_classes = _topk_with_other(distributions.get("issue_classes", {}))
         if issue_classes:
             st.markdown(f"<h4 style='color: {COLORS['text']}'>Issue Classes</h4>", unsafe_allow_html=True)
-            fig = go.Figure(data=[go.Bar(
+            fig = new_chart("bar")
+            fig.update_traces(
                 x=list(issue_classes.keys()),
                 y=list(issue_classes.values()),
                 marker_color=COLORS['primary']
-            )])
-            fig = apply_plotly_theme(fig)
-            fig.update_layout(height=350)
+            )
             st.plotly_chart(fig, use_container_width=True)
 
     with col2:
-        resolution_outlooks = distributions.get("resolution_outlooks", {})
+        resolution_outlooks = _topk_with_other(distributions.get("resolution_outlooks", {}))
         if resolution_outlooks:
             st.markdown(f"<h4 style='color: {COLORS['text']}'>Resolution Outlooks</h4>", unsafe_allow_html=True)
-            fig = go.Figure(data=[go.Bar(
+            fig = new_chart("bar")
+            fig.update_traces(
                 x=list(resolution_outlooks.keys()),
                 y=list(resolution_outlooks.values()),
                 marker_color=COLORS['secondary']
-            )])
-            fig = apply_plotly_theme(fig)
-            fig.update_layout(height=350)
+            )
             st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("</div>", unsafe_allow_html=True)  # Close content-card
@@ -2,6 +2,7 @@
 Cases Page - Case browser with filters and AI analysis details.
 """
 
+import numpy as np
 import streamlit as st
 import pandas as pd
 
@@ -10,11 +11,211 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.dashboard.branding import (
-    COLORS, get_health_color, get_frustration_color,
-    get_severity_color, get_priority_color
+    COLORS, SEVERITY_COLORS, SIDEBAR_HEADER_HTML, get_health_color, get_frustration_color,
+    get_frustration_colors, get_severity_color, get_priority_color
 )
 from src.dashboard.styles import get_global_css
-from src.dashboard.filters import get_filtered_cases, get_view_mode_indicator_html
+from src.dashboard.filters import get_view_mode_indicator_html
+from src.dashboard.session import get_results_token, get_view_cases
+
+
+# HTML fragments - colors are baked in at import, per-render values use str.format
+# Fixed markup renders through st.html, as in app.py; templates that carry AI-written
+# text (summaries, pain points, key phrase) stay on st.markdown.
+DETAIL_PANEL_HEADER_TEMPLATE = """
+    <div class="metric-detail-panel">
+        <div class="metric-detail-header">
+            <span class="metric-detail-title" style="color: {color};">{title} ({count} cases)</span>
+        </div>
+    </div>
+    """
+
+CASES_HEADER_TEMPLATE = f"""
+    <div style="background: linear-gradient(135deg, {COLORS['surface']} 0%, {COLORS['background']} 100%);
+                padding: 1.5rem; border-radius: 12px; margin-bottom: 1.5rem;
+                border: 1px solid {COLORS['border']}; border-left: 4px solid {COLORS['primary']};">
+        <h1 style="color: {COLORS['primary']}; margin: 0; font-size: 1.8rem;">Case Browser</h1>
+        <p style="color: {COLORS['text_muted']}; margin: 10px 0 0 0;">
+            {{case_count}} cases analyzed - click a row to view details
+        </p>
+    </div>
+    """
+
+CRITICAL_HERO_TEMPLATE = """
+        <div class="hero-metric clickable {active_class}" style="padding: 1rem 1.5rem; border-color: {color}; border-width: 2px;">
+            <div class="hero-metric-value" style="font-size: 2rem; color: {color};">{value}</div>
+            <div class="hero-metric-label" style="font-size: 0.75rem;">Critical (180+)</div>
+        </div>
+        """
+
+HIGH_HERO_TEMPLATE = """
+        <div class="hero-metric clickable {active_class}" style="padding: 1rem 1.5rem; border-color: {color}; border-width: 2px;">
+            <div class="hero-metric-value" style="font-size: 2rem; color: {color};">{value}</div>
+            <div class="hero-metric-label" style="font-size: 0.75rem;">High (140-179)</div>
+        </div>
+        """
+
+TIMELINE_HERO_TEMPLATE = f"""
+        <div class="hero-metric clickable {{active_class}}" style="padding: 1rem 1.5rem;">
+            <div class="hero-metric-value" style="font-size: 2rem; color: {COLORS['primary']};">{{value}}</div>
+            <div class="hero-metric-label" style="font-size: 0.75rem;">With Timeline</div>
+        </div>
+        """
+
+TOTAL_HERO_TEMPLATE = f"""
+        <div class="hero-metric" style="padding: 1rem 1.5rem;">
+            <div class="hero-metric-value" style="font-size: 2rem; color: {COLORS['text']};">{{value}}</div>
+            <div class="hero-metric-label" style="font-size: 0.75rem;">Total Open</div>
+        </div>
+        """
+
+MATCH_COUNT_TEMPLATE = f"<p style='color: {COLORS['text_muted']}'>{{count}} cases match filters</p>"
+
+CASE_HEADER_TEMPLATE = f"""
+    <div style="background: {COLORS['surface']}; padding: 1.5rem; border-radius: 12px;
+                border: 1px solid {COLORS['border']}; margin-bottom: 1rem;">
+        <div style="display: flex; justify-content: space-between; align-items: center;">
+            <div>
+                <h2 style="color: {COLORS['text']}; margin: 0;">Case {{case_number}}</h2>
+                <p style="color: {COLORS['text_muted']}; margin: 5px 0 0 0;">{{customer_name}}</p>
+            </div>
+            <div style="text-align: right;">
+                <span style="background: {{frust_color}}; color: white; padding: 4px 12px;
+                             border-radius: 20px; font-weight: bold; margin-left: 8px;">
+                    Frustration: {{frustration}}/10
+                </span>
+                <span style="background: {{severity_color}}; color: white; padding: 4px 12px;
+                             border-radius: 20px; font-weight: bold; margin-left: 8px;">
+                    {{severity}}
+                </span>
+            </div>
+        </div>
+    </div>
+    """
+
+AI_SUMMARY_OPEN_TEMPLATE = f"""
+            <div style="background: {COLORS['surface']};
+                        padding: 1.25rem; border-radius: 10px; margin-bottom: 1rem;
+                        border: 1px solid {{crit_color}}; border-left: 4px solid {{crit_color}};">
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="font-size: 1.1rem; margin-right: 8px;">🤖</span>
+                    <strong style="color: {{crit_color}};">AI Case Summary</strong>
+                    <span style="color: {COLORS['text_muted']}; margin-left: auto; font-size: 0.85rem;">
+                        Criticality: {{criticality:.0f}}
+                    </span>
+                </div>
+            """
+
+SUMMARY_ITEM_TEMPLATE = f"""
+                <div style="margin-bottom: 0.75rem;">
+                    <strong style="color: {{color}}; font-size: 0.9rem;">{{title}}</strong>
+                    <p style="color: {COLORS['text']}; margin: 4px 0 0 0; font-size: 0.95rem;">{{content}}</p>
+                </div>
+                """
+
+QUICK_PRIORITY_TEMPLATE = f"""
+        <div style="background: {COLORS['surface']}; padding: 1rem; border-radius: 8px;
+                    border: 1px solid {COLORS['border']}; margin: 1rem 0;">
+            <span style="background: {{priority_color}}; color: white; padding: 4px 12px;
+                         border-radius: 4px; font-weight: bold;">Priority: {{priority}}</span>
+            <span style="color: {COLORS['text_muted']}; margin-left: 1rem;">
+                Frustration Rate: {{frustration_frequency}}% |
+                Damage Rate: {{damage_frequency}}%
+            </span>
+        </div>
+        """
+
+JUSTIFICATION_TEMPLATE = f"""
+            <div style="background: {COLORS['surface']}; border-left: 4px solid {COLORS['primary']};
+                        padding: 15px; border-radius: 0 8px 8px 0; margin-bottom: 1rem;">
+                <strong style="color: {COLORS['text']};">Justification:</strong>
+                <p style="color: {COLORS['text_muted']}; margin: 5px 0 0 0;">{{justification}}</p>
+            </div>
+            """
+
+AI_ANALYSIS_HEADING_HTML = f"<h3 style='color: {COLORS['text']}'>AI Analysis</h3>"
+
+EXECUTIVE_SUMMARY_TEMPLATE = f"""
+            <div style="background: {COLORS['surface']}; border-left: 4px solid {COLORS['primary']};
+                        padding: 15px; border-radius: 0 8px 8px 0; margin-bottom: 1rem;">
+                <strong style="color: {COLORS['primary']};">Executive Summary</strong>
+                <p style="color: {COLORS['text']}; margin: 10px 0 0 0;">{{text}}</p>
+            </div>
+            """
+
+PAIN_POINTS_TEMPLATE = f"""
+                <div style="background: {COLORS['warning_tint']}; border-left: 4px solid {COLORS['warning']};
+                            padding: 15px; border-radius: 0 8px 8px 0;">
+                    <strong style="color: {COLORS['warning']};">Pain Points</strong>
+                    <p style="color: {COLORS['text']}; margin: 10px 0 0 0;">{{text}}</p>
+                </div>
+                """
+
+SENTIMENT_TREND_TEMPLATE = f"""
+                <div style="background: {COLORS['surface']}; border-left: 4px solid {COLORS['secondary']};
+                            padding: 15px; border-radius: 0 8px 8px 0; margin-top: 1rem;">
+                    <strong style="color: {COLORS['secondary']};">Sentiment Trend</strong>
+                    <p style="color: {COLORS['text']}; margin: 10px 0 0 0;">{{text}}</p>
+                </div>
+                """
+
+RECOMMENDED_ACTION_TEMPLATE = f"""
+                <div style="background: {COLORS['success_tint']}; border-left: 4px solid {COLORS['success']};
+                            padding: 15px; border-radius: 0 8px 8px 0;">
+                    <strong style="color: {COLORS['success']};">Recommended Action</strong>
+                    <p style="color: {COLORS['text']}; margin: 10px 0 0 0;">{{text}}</p>
+                </div>
+                """
+
+CUSTOMER_PRIORITY_TEMPLATE = f"""
+                <div style="background: {COLORS['surface']}; border-left: 4px solid {{priority_color}};
+                            padding: 15px; border-radius: 0 8px 8px 0; margin-top: 1rem;">
+                    <strong style="color: {{priority_color}};">Customer Priority: {{priority}}</strong>
+                </div>
+                """
+
+INFLECTION_POINTS_TEMPLATE = f"""
+            <div style="background: {COLORS['surface']}; border-left: 4px solid {COLORS['text_muted']};
+                        padding: 15px; border-radius: 0 8px 8px 0; margin-top: 1rem;">
+                <strong style="color: {COLORS['text']};">Critical Inflection Points</strong>
+                <p style="color: {COLORS['text_muted']}; margin: 10px 0 0 0;">{{text}}</p>
+            </div>
+            """
+
+TIMELINE_LINK_TEMPLATE = f"""
+            <div style="background: {COLORS['surface']}; padding: 1rem; border-radius: 8px;
+                        border: 1px solid {COLORS['border']}; margin-top: 1rem; text-align: center;">
+                <p style="color: {COLORS['text']}; margin: 0;">
+                    This case has <strong>{{count}}</strong> timeline entries.
+                    View the full timeline on the <strong>Timeline</strong> page.
+                </p>
+            </div>
+            """
+
+KEY_PHRASE_HEADING_HTML = f"<h3 style='color: {COLORS['text']}'>Key Phrase</h3>"
+
+KEY_PHRASE_TEMPLATE = f"""
+        <div style="background: {COLORS['warning_tint']}; border-left: 4px solid {COLORS['warning']};
+                    padding: 15px; border-radius: 0 8px 8px 0;">
+            <p style="color: {COLORS['text']}; margin: 0; font-style: italic;">
+                "{{key_phrase}}"
+            </p>
+        </div>
+        """
+
+MESSAGE_SCORES_HEADING_HTML = f"<p style='color: {COLORS['text']}; margin-top: 1rem;'><strong>Message Scores (first 10):</strong></p>"
+
+MESSAGE_SCORE_TEMPLATE = f"""
+                    <div style="display: flex; align-items: center; margin: 5px 0;">
+                        <span style="background: {{color}}; color: white; padding: 2px 8px;
+                                     border-radius: 4px; font-weight: bold; min-width: 30px; text-align: center;">
+                            {{score}}
+                        </span>
+                        <span style="color: {COLORS['text_muted']}; margin-left: 10px; font-size: 0.9rem;">
+                            Msg {{msg}}: {{reason}}
+                        </span>
+                    </div>
+                    """
 
 
 def render_cases_metric_detail_panel(title: str, cases_list: list, color: str):
@@ -23,13 +224,11 @@ def render_cases_metric_detail_panel(title: str, cases_list: list, color: str):
         st.info(f"No cases in this category")
         return
 
-    st.markdown(f"""
-    <div class="metric-detail-panel">
-        <div class="metric-detail-header">
-            <span class="metric-detail-title" style="color: {color};">{title} ({len(cases_list)} cases)</span>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(DETAIL_PANEL_HEADER_TEMPLATE.format(
+        color=color,
+        title=title,
+        count=len(cases_list),
+    ))
 
     # Create a mini dataframe for display
     display_data = []
@@ -51,6 +250,142 @@ def render_cases_metric_detail_panel(title: str, cases_list: list, color: str):
             st.caption(f"Showing top 10 of {len(cases_list)} cases. Use filters above to narrow down.")
 
 
+# Flattened case field -> table column, in display order
+TABLE_COLUMNS = {
+    "case_number": "Case #",
+    "customer_name": "Customer",
+    "criticality_score": "Criticality",
+    "claude_analysis.frustration_score": "Frustration",
+    "severity": "Severity",
+    "claude_analysis.issue_class": "Issue Class",
+    "claude_analysis.resolution_outlook": "Resolution",
+    "deepseek_quick_scoring.priority": "Priority",
+    "case_age_days": "Age (days)",
+    "interaction_count": "Messages",
+}
+
+# Defaults for cases where a field (or the whole analysis block) is missing
+TABLE_DEFAULTS = {
+    "customer_name": "",
+    "criticality_score": 0,
+    "claude_analysis.frustration_score": 0,
+    "severity": "S4",
+    "claude_analysis.issue_class": "Unknown",
+    "claude_analysis.resolution_outlook": "Unknown",
+    "deepseek_quick_scoring.priority": "-",
+    "case_age_days": 0,
+    "interaction_count": 0,
+}
+
+
+def _project_case(case: dict) -> tuple:
+    """Pull the scalar fields the browser needs, in TABLE_COLUMNS order plus has_timeline."""
+    claude = case.get("claude_analysis") or {}
+    quick = case.get("deepseek_quick_scoring") or {}
+    deepseek = case.get("deepseek_analysis") or {}
+    return (
+        case.get("case_number"),
+        case.get("customer_name"),
+        case.get("criticality_score"),
+        claude.get("frustration_score"),
+        case.get("severity"),
+        claude.get("issue_class"),
+        claude.get("resolution_outlook"),
+        quick.get("priority"),
+        case.get("case_age_days"),
+        case.get("interaction_count"),
+        bool(deepseek.get("timeline_entries")),
+    )
+
+
+def cases_key(view_mode: str, cases: list) -> str:
+    """Cache key for a case list: results token, view mode and a fingerprint of the list.
+
+    The fingerprint (length plus case numbers) ties cached frames and row indices
+    to the exact list they were computed from, even if the list is rebuilt under
+    the same results token.
+    """
+    fingerprint = hash(tuple(case.get("case_number") for case in cases))
+    return f"{get_results_token()}:{view_mode}:{len(cases)}:{fingerprint}"
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def cases_frame(cases_key: str, _cases: list) -> pd.DataFrame:
+    """Project the cases once per case list into one row per case, in list order.
+
+    Only the table/filter fields are copied out of the nested dicts. Values are
+    left raw (NaN where missing) so the filters see the same data the dicts hold;
+    build_cases_table applies display defaults afterwards.
+    """
+    frame = pd.DataFrame.from_records(
+        [_project_case(case) for case in _cases],
+        columns=[*TABLE_COLUMNS, "has_timeline"],
+    )
+    # Pin the filtered columns' dtypes - an all-None column would otherwise be object
+    frame = frame.astype({
+        "criticality_score": float,
+        "claude_analysis.frustration_score": float,
+        "has_timeline": bool,
+    })
+
+    # Badge colors for the detail header, looked up once per column
+    frame["frust_color"] = get_frustration_colors(frame["claude_analysis.frustration_score"])
+    frame["severity_color"] = frame["severity"].map(SEVERITY_COLORS).fillna(COLORS["text_muted"])
+    return frame
+
+
+def build_cases_table(rows: pd.DataFrame) -> pd.DataFrame:
+    """Turn cases_frame rows into the browser table with column operations."""
+    df = rows[list(TABLE_COLUMNS)].fillna(TABLE_DEFAULTS).reset_index(drop=True)
+
+    # Arrow-backed strings slice the whole column in one kernel call
+    df["customer_name"] = df["customer_name"].astype("string[pyarrow]").str.slice(0, 35)
+    df["criticality_score"] = df["criticality_score"].round(1)
+    # Filling NaN promotes whole-number columns to float; bring them back to ints
+    for col in ("claude_analysis.frustration_score", "case_age_days", "interaction_count"):
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+
+    df["Has Timeline"] = rows["has_timeline"].map({True: "Yes", False: "No"}).to_numpy()
+    return df.rename(columns=TABLE_COLUMNS)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def filter_case_indices(cases_key: str, severity: tuple,
+                        min_frustration: int, min_criticality: int, has_timeline: bool,
+                        _cases: list) -> list:
+    """Apply the browser filters as one DataFrame.query over cases_frame.
+
+    Only the active filters go into the expression. pandas evaluates it with
+    numexpr when that is installed and falls back to the python engine otherwise.
+
+    Args:
+        cases_key: cases_key() of _cases (_cases itself is not hashed)
+        severity: Sorted tuple of severities to keep (empty keeps all)
+
+    Returns:
+        Indices into _cases, highest criticality first
+    """
+    frame = cases_frame(cases_key, _cases)
+
+    # Missing scores are NaN, which fails every >= comparison just like a 0 would
+    query_parts = []
+    if severity:
+        query_parts.append("severity in @severity")
+    if min_frustration:
+        query_parts.append("`claude_analysis.frustration_score` >= @min_frustration")
+    if min_criticality:
+        query_parts.append("criticality_score >= @min_criticality")
+    if has_timeline:
+        query_parts.append("has_timeline")
+    if query_parts:
+        frame = frame.query(" and ".join(query_parts))
+
+    # Sort by criticality score descending (highest first), ties keep list order.
+    # cases_frame has a RangeIndex, so the surviving labels are positions in _cases.
+    criticality = frame["criticality_score"].fillna(0).to_numpy()
+    return frame.index.to_numpy()[np.argsort(-criticality, kind="stable")].tolist()
+
+
 # Page config
 st.set_page_config(
     page_title="Cases - Customer Sentiment",
@@ -63,11 +398,7 @@ st.markdown(get_global_css(), unsafe_allow_html=True)
 
 # Sidebar with view mode toggle
 with st.sidebar:
-    st.markdown(f"""
-    <div style="text-align: center; padding: 0.5rem 0; border-bottom: 1px solid {COLORS['border']}; margin-bottom: 0.75rem;">
-        <h3 style="color: {COLORS['primary']}; margin: 0;">Customer Sentiment</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(SIDEBAR_HEADER_HTML)
 
     # View Mode Toggle - synced across all pages via session state
     if 'view_mode' not in st.session_state:
@@ -92,18 +423,16 @@ def main():
         st.session_state['selected_metric_cases'] = None
 
     # Check for results
-    if 'analysis_results' not in st.session_state:
+    results = st.session_state.get('analysis_results')
+    if results is None:
         st.warning("No analysis results found. Please run an analysis from the main page first.")
         if st.button("Go to Main Page"):
             st.switch_page("app.py")
         return
 
-    results = st.session_state['analysis_results']
-    cases = results.get("cases", [])
-
     # Apply view mode filter
     view_mode = st.session_state.get('view_mode', 'All Cases')
-    cases = get_filtered_cases(cases, view_mode)
+    cases = get_view_cases(view_mode)
 
     # Show view mode indicator
     indicator_html = get_view_mode_indicator_html(view_mode, len(cases), COLORS)
@@ -111,16 +440,7 @@ def main():
         st.markdown(indicator_html, unsafe_allow_html=True)
 
     # Header
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {COLORS['surface']} 0%, {COLORS['background']} 100%);
-                padding: 1.5rem; border-radius: 12px; margin-bottom: 1.5rem;
-                border: 1px solid {COLORS['border']}; border-left: 4px solid {COLORS['primary']};">
-        <h1 style="color: {COLORS['primary']}; margin: 0; font-size: 1.8rem;">Case Browser</h1>
-        <p style="color: {COLORS['text_muted']}; margin: 10px 0 0 0;">
-            {len(cases)} cases analyzed - click a row to view details
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(CASES_HEADER_TEMPLATE.format(case_count=len(cases)))
 
     # Quick summary stats - CLICKABLE
     critical_cases = [c for c in cases if c.get("criticality_score", 0) >= 180]
@@ -134,12 +454,11 @@ def main():
         crit_color = COLORS['critical'] if len(critical_cases) > 0 else COLORS['text_muted']
         is_active = selected == 'critical'
         active_class = "active" if is_active else ""
-        st.markdown(f"""
-        <div class="hero-metric clickable {active_class}" style="padding: 1rem 1.5rem; border-color: {crit_color}; border-width: 2px;">
-            <div class="hero-metric-value" style="font-size: 2rem; color: {crit_color};">{len(critical_cases)}</div>
-            <div class="hero-metric-label" style="font-size: 0.75rem;">Critical (180+)</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(CRITICAL_HERO_TEMPLATE.format(
+            active_class=active_class,
+            color=crit_color,
+            value=len(critical_cases),
+        ))
         if st.button("View details", key="cases_btn_critical", use_container_width=True):
             st.session_state['selected_metric_cases'] = None if is_active else 'critical'
             st.rerun()
@@ -148,12 +467,11 @@ def main():
         high_color = COLORS['warning'] if len(high_cases) > 0 else COLORS['text_muted']
         is_active = selected == 'high'
         active_class = "active" if is_active else ""
-        st.markdown(f"""
-        <div class="hero-metric clickable {active_class}" style="padding: 1rem 1.5rem; border-color: {high_color}; border-width: 2px;">
-            <div class="hero-metric-value" style="font-size: 2rem; color: {high_color};">{len(high_cases)}</div>
-            <div class="hero-metric-label" style="font-size: 0.75rem;">High (140-179)</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(HIGH_HERO_TEMPLATE.format(
+            active_class=active_class,
+            color=high_color,
+            value=len(high_cases),
+        ))
         if st.button("View details", key="cases_btn_high", use_container_width=True):
             st.session_state['selected_metric_cases'] = None if is_active else 'high'
             st.rerun()
@@ -161,23 +479,16 @@ def main():
     with qcol3:
         is_active = selected == 'timeline'
         active_class = "active" if is_active else ""
-        st.markdown(f"""
-        <div class="hero-metric clickable {active_class}" style="padding: 1rem 1.5rem;">
-            <div class="hero-metric-value" style="font-size: 2rem; color: {COLORS['primary']};">{len(timeline_cases)}</div>
-            <div class="hero-metric-label" style="font-size: 0.75rem;">With Timeline</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(TIMELINE_HERO_TEMPLATE.format(
+            active_class=active_class,
+            value=len(timeline_cases),
+        ))
         if st.button("View details", key="cases_btn_timeline", use_container_width=True):
             st.session_state['selected_metric_cases'] = None if is_active else 'timeline'
             st.rerun()
 
     with qcol4:
-        st.markdown(f"""
-        <div class="hero-metric" style="padding: 1rem 1.5rem;">
-            <div class="hero-metric-value" style="font-size: 2rem; color: {COLORS['text']};">{len(cases)}</div>
-            <div class="hero-metric-label" style="font-size: 0.75rem;">Total Open</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(TOTAL_HERO_TEMPLATE.format(value=len(cases)))
 
     # === DETAIL PANEL - Shows when a metric is selected ===
     if selected:
@@ -226,85 +537,87 @@ def main():
     with col4:
         has_timeline = st.checkbox("Has Timeline", value=False)
 
-    # Filter cases
-    filtered_cases = cases
-    if severity_filter:
-        filtered_cases = [c for c in filtered_cases if c.get("severity") in severity_filter]
-    if min_frustration > 0:
-        filtered_cases = [c for c in filtered_cases
-                        if c.get("claude_analysis", {}).get("frustration_score", 0) >= min_frustration]
-    if min_criticality > 0:
-        filtered_cases = [c for c in filtered_cases
-                        if c.get("criticality_score", 0) >= min_criticality]
-    if has_timeline:
-        filtered_cases = [c for c in filtered_cases
-                        if c.get("deepseek_analysis", {}).get("timeline_entries")]
-
-    # Sort by criticality score descending (highest first)
-    filtered_cases = sorted(filtered_cases, key=lambda c: c.get("criticality_score", 0), reverse=True)
+    # Filter cases - cached per filter combination, so reruns from row clicks or the
+    # metric buttons reuse the previous pass. filtered_cases keeps the original dicts
+    # in table order for the detail view.
+    key = cases_key(view_mode, cases)
+    order = filter_case_indices(
+        key,
+        tuple(sorted(severity_filter)), min_frustration, min_criticality, has_timeline,
+        _cases=cases,
+    )
+    filtered_cases = [cases[i] for i in order]
 
-    st.markdown(f"<p style='color: {COLORS['text_muted']}'>{len(filtered_cases)} cases match filters</p>",
-                unsafe_allow_html=True)
+    st.html(MATCH_COUNT_TEMPLATE.format(count=len(filtered_cases)))
 
     # Build table data (no Rank column - table is already sorted by criticality)
-    table_data = []
-    for case in filtered_cases:
-        claude = case.get("claude_analysis") or {}
-        quick = case.get("deepseek_quick_scoring") or {}
-        deepseek = case.get("deepseek_analysis") or {}
-
-        table_data.append({
-            "Case #": case.get("case_number"),
-            "Customer": str(case.get("customer_name", ""))[:35],
-            "Criticality": round(case.get("criticality_score", 0), 1),
-            "Frustration": claude.get("frustration_score", 0),
-            "Severity": case.get("severity", "S4"),
-            "Issue Class": claude.get("issue_class", "Unknown"),
-            "Resolution": claude.get("resolution_outlook", "Unknown"),
-            "Priority": quick.get("priority", "-"),
-            "Age (days)": case.get("case_age_days", 0),
-            "Messages": case.get("interaction_count", 0),
-            "Has Timeline": "Yes" if deepseek.get("timeline_entries") else "No",
-        })
+    if filtered_cases:
+        rows = cases_frame(key, cases).take(order)
+        render_case_table(build_cases_table(rows), filtered_cases, rows)
+    else:
+        st.info("No cases match the current filters.")
 
-    if table_data:
-        df = pd.DataFrame(table_data)
-
-        # Display table with selection
-        event = st.dataframe(
-            df,
-            use_container_width=True,
-            hide_index=True,
-            selection_mode="single-row",
-            on_select="rerun",
-            column_config={
-                "Criticality": st.column_config.ProgressColumn(
-                    min_value=0,
-                    max_value=250,
-                    format="%.0f"
-                ),
-                "Frustration": st.column_config.ProgressColumn(
-                    min_value=0,
-                    max_value=10,
-                    format="%.0f"
-                ),
-            }
-        )
 
-        # Handle row selection
-        selected_rows = event.selection.rows if hasattr(event, 'selection') else []
+# Above this many rows the score bars cost more to ship than they add
+PROGRESS_COLUMN_MAX_ROWS = 500
+
+
+def table_column_config(n_rows: int) -> dict:
+    """Column config for the case table: score bars up to PROGRESS_COLUMN_MAX_ROWS, plain numbers beyond."""
+    if n_rows <= PROGRESS_COLUMN_MAX_ROWS:
+        return {
+            "Criticality": st.column_config.ProgressColumn(
+                min_value=0,
+                max_value=250,
+                format="%.0f"
+            ),
+            "Frustration": st.column_config.ProgressColumn(
+                min_value=0,
+                max_value=10,
+                format="%.0f"
+            ),
+        }
+    return {
+        "Criticality": st.column_config.NumberColumn(format="%.0f"),
+        "Frustration": st.column_config.NumberColumn(format="%.0f"),
+    }
+
+
+@st.fragment
+def render_case_table(df: pd.DataFrame, filtered_cases: list, rows: pd.DataFrame):
+    """Render the case table and the selected case's detail.
+
+    rows are the cases_frame rows behind df (same order), used for the
+    precomputed badge colors.
+
+    Runs as a fragment: selecting a row reruns only this block instead of the
+    whole page (hero metrics, filters and the filter pass above stay as they are).
+    """
+    # Display table with selection
+    event = st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        selection_mode="single-row",
+        on_select="rerun",
+        column_config=table_column_config(len(df))
+    )
 
-        if selected_rows:
-            selected_idx = selected_rows[0]
-            selected_case = filtered_cases[selected_idx]
-            display_case_detail(selected_case)
+    # Handle row selection
+    selected_rows = event.selection.rows if hasattr(event, 'selection') else []
+
+    if selected_rows:
+        selected_idx = selected_rows[0]
+        selected_case = filtered_cases[selected_idx]
+        row = rows.iloc[selected_idx]
+        display_case_detail(selected_case, row["frust_color"], row["severity_color"])
 
-    else:
-        st.info("No cases match the current filters.")
 
+def display_case_detail(case: dict, frust_color: str = None, severity_color: str = None):
+    """Display detailed case information.
 
-def display_case_detail(case: dict):
-    """Display detailed case information."""
+    The badge colors can be passed in from cases_frame; they are looked up when omitted.
+    """
 
     st.divider()
 
@@ -315,30 +628,17 @@ def display_case_detail(case: dict):
 
     # Case header
     frustration = claude.get("frustration_score", 0)
-    frust_color = get_frustration_color(frustration)
-    severity_color = get_severity_color(case.get("severity", "S4"))
-
-    st.markdown(f"""
-    <div style="background: {COLORS['surface']}; padding: 1.5rem; border-radius: 12px;
-                border: 1px solid {COLORS['border']}; margin-bottom: 1rem;">
-        <div style="display: flex; justify-content: space-between; align-items: center;">
-            <div>
-                <h2 style="color: {COLORS['text']}; margin: 0;">Case {case.get('case_number')}</h2>
-                <p style="color: {COLORS['text_muted']}; margin: 5px 0 0 0;">{case.get('customer_name', 'Unknown')}</p>
-            </div>
-            <div style="text-align: right;">
-                <span style="background: {frust_color}; color: white; padding: 4px 12px;
-                             border-radius: 20px; font-weight: bold; margin-left: 8px;">
-                    Frustration: {frustration}/10
-                </span>
-                <span style="background: {severity_color}; color: white; padding: 4px 12px;
-                             border-radius: 20px; font-weight: bold; margin-left: 8px;">
-                    {case.get('severity', 'S4')}
-                </span>
-            </div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    frust_color = frust_color or get_frustration_color(frustration)
+    severity_color = severity_color or get_severity_color(case.get("severity", "S4"))
+
+    st.markdown(CASE_HEADER_TEMPLATE.format(
+        case_number=case.get('case_number'),
+        customer_name=case.get('customer_name', 'Unknown'),
+        frust_color=frust_color,
+        frustration=frustration,
+        severity_color=severity_color,
+        severity=case.get('severity', 'S4'),
+    ), unsafe_allow_html=True)
 
     # AI Summary Card for high criticality cases (>= 100)
     if criticality >= 100:
@@ -356,28 +656,15 @@ def display_case_detail(case: dict):
 
         if summary_content:
             crit_color = COLORS['critical'] if criticality >= 180 else COLORS['warning']
-            st.markdown(f"""
-            <div style="background: {COLORS['surface']};
-                        padding: 1.25rem; border-radius: 10px; margin-bottom: 1rem;
-                        border: 1px solid {crit_color}; border-left: 4px solid {crit_color};">
-                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
-                    <span style="font-size: 1.1rem; margin-right: 8px;">🤖</span>
-                    <strong style="color: {crit_color};">AI Case Summary</strong>
-                    <span style="color: {COLORS['text_muted']}; margin-left: auto; font-size: 0.85rem;">
-                        Criticality: {criticality:.0f}
-                    </span>
-                </div>
-            """, unsafe_allow_html=True)
-
-            for title, content, color in summary_content:
-                st.markdown(f"""
-                <div style="margin-bottom: 0.75rem;">
-                    <strong style="color: {color}; font-size: 0.9rem;">{title}</strong>
-                    <p style="color: {COLORS['text']}; margin: 4px 0 0 0; font-size: 0.95rem;">{content}</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-            st.markdown("</div>", unsafe_allow_html=True)
+            # One element for the whole card, so the items render inside its div
+            items_html = "".join(
+                SUMMARY_ITEM_TEMPLATE.format(color=color, title=title, content=content)
+                for title, content, color in summary_content
+            )
+            st.html(AI_SUMMARY_OPEN_TEMPLATE.format(
+                crit_color=crit_color,
+                criticality=criticality,
+            ) + items_html + "</div>")
 
     # Metrics row
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -398,120 +685,78 @@ def display_case_detail(case: dict):
         priority = quick.get("priority", "Medium")
         priority_color = get_priority_color(priority)
 
-        st.markdown(f"""
-        <div style="background: {COLORS['surface']}; padding: 1rem; border-radius: 8px;
-                    border: 1px solid {COLORS['border']}; margin: 1rem 0;">
-            <span style="background: {priority_color}; color: white; padding: 4px 12px;
-                         border-radius: 4px; font-weight: bold;">Priority: {priority}</span>
-            <span style="color: {COLORS['text_muted']}; margin-left: 1rem;">
-                Frustration Rate: {quick.get('frustration_frequency', 0)}% |
-                Damage Rate: {quick.get('damage_frequency', 0)}%
-            </span>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(QUICK_PRIORITY_TEMPLATE.format(
+            priority_color=priority_color,
+            priority=priority,
+            frustration_frequency=quick.get('frustration_frequency', 0),
+            damage_frequency=quick.get('damage_frequency', 0),
+        ), unsafe_allow_html=True)
 
         if quick.get("justification"):
-            st.markdown(f"""
-            <div style="background: {COLORS['surface']}; border-left: 4px solid {COLORS['primary']};
-                        padding: 15px; border-radius: 0 8px 8px 0; margin-bottom: 1rem;">
-                <strong style="color: {COLORS['text']};">Justification:</strong>
-                <p style="color: {COLORS['text_muted']}; margin: 5px 0 0 0;">{quick['justification']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(JUSTIFICATION_TEMPLATE.format(
+                justification=quick['justification'],
+            ), unsafe_allow_html=True)
 
     # Detailed analysis (if available)
     if deepseek and deepseek.get("analysis_successful"):
-        st.markdown(f"<h3 style='color: {COLORS['text']}'>AI Analysis</h3>", unsafe_allow_html=True)
+        st.html(AI_ANALYSIS_HEADING_HTML)
 
         # Executive summary
         if deepseek.get("executive_summary"):
-            st.markdown(f"""
-            <div style="background: {COLORS['surface']}; border-left: 4px solid {COLORS['primary']};
-                        padding: 15px; border-radius: 0 8px 8px 0; margin-bottom: 1rem;">
-                <strong style="color: {COLORS['primary']};">Executive Summary</strong>
-                <p style="color: {COLORS['text']}; margin: 10px 0 0 0;">{deepseek['executive_summary']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(EXECUTIVE_SUMMARY_TEMPLATE.format(
+                text=deepseek['executive_summary'],
+            ), unsafe_allow_html=True)
 
         col1, col2 = st.columns(2)
 
         with col1:
             # Pain points
             if deepseek.get("pain_points"):
-                st.markdown(f"""
-                <div style="background: {COLORS['warning_tint']}; border-left: 4px solid {COLORS['warning']};
-                            padding: 15px; border-radius: 0 8px 8px 0;">
-                    <strong style="color: {COLORS['warning']};">Pain Points</strong>
-                    <p style="color: {COLORS['text']}; margin: 10px 0 0 0;">{deepseek['pain_points']}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(PAIN_POINTS_TEMPLATE.format(
+                    text=deepseek['pain_points'],
+                ), unsafe_allow_html=True)
 
             # Sentiment trend
             if deepseek.get("sentiment_trend"):
-                st.markdown(f"""
-                <div style="background: {COLORS['surface']}; border-left: 4px solid {COLORS['secondary']};
-                            padding: 15px; border-radius: 0 8px 8px 0; margin-top: 1rem;">
-                    <strong style="color: {COLORS['secondary']};">Sentiment Trend</strong>
-                    <p style="color: {COLORS['text']}; margin: 10px 0 0 0;">{deepseek['sentiment_trend']}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(SENTIMENT_TREND_TEMPLATE.format(
+                    text=deepseek['sentiment_trend'],
+                ), unsafe_allow_html=True)
 
         with col2:
             # Recommended action
             if deepseek.get("recommended_action"):
-                st.markdown(f"""
-                <div style="background: {COLORS['success_tint']}; border-left: 4px solid {COLORS['success']};
-                            padding: 15px; border-radius: 0 8px 8px 0;">
-                    <strong style="color: {COLORS['success']};">Recommended Action</strong>
-                    <p style="color: {COLORS['text']}; margin: 10px 0 0 0;">{deepseek['recommended_action']}</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(RECOMMENDED_ACTION_TEMPLATE.format(
+                    text=deepseek['recommended_action'],
+                ), unsafe_allow_html=True)
 
             # Customer priority
             if deepseek.get("customer_priority"):
                 priority = deepseek['customer_priority']
                 priority_color = get_priority_color(priority)
-                st.markdown(f"""
-                <div style="background: {COLORS['surface']}; border-left: 4px solid {priority_color};
-                            padding: 15px; border-radius: 0 8px 8px 0; margin-top: 1rem;">
-                    <strong style="color: {priority_color};">Customer Priority: {priority}</strong>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown(CUSTOMER_PRIORITY_TEMPLATE.format(
+                    priority_color=priority_color,
+                    priority=priority,
+                ), unsafe_allow_html=True)
 
         # Critical inflection points
         if deepseek.get("critical_inflection_points"):
-            st.markdown(f"""
-            <div style="background: {COLORS['surface']}; border-left: 4px solid {COLORS['text_muted']};
-                        padding: 15px; border-radius: 0 8px 8px 0; margin-top: 1rem;">
-                <strong style="color: {COLORS['text']};">Critical Inflection Points</strong>
-                <p style="color: {COLORS['text_muted']}; margin: 10px 0 0 0;">{deepseek['critical_inflection_points']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(INFLECTION_POINTS_TEMPLATE.format(
+                text=deepseek['critical_inflection_points'],
+            ), unsafe_allow_html=True)
 
         # Timeline link
         timeline_entries = deepseek.get("timeline_entries", [])
         if timeline_entries:
-            st.markdown(f"""
-            <div style="background: {COLORS['surface']}; padding: 1rem; border-radius: 8px;
-                        border: 1px solid {COLORS['border']}; margin-top: 1rem; text-align: center;">
-                <p style="color: {COLORS['text']}; margin: 0;">
-                    This case has <strong>{len(timeline_entries)}</strong> timeline entries.
-                    View the full timeline on the <strong>Timeline</strong> page.
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(TIMELINE_LINK_TEMPLATE.format(
+                count=len(timeline_entries),
+            ), unsafe_allow_html=True)
 
     # Key phrase (fallback if no detailed analysis)
     elif claude.get("key_phrase"):
-        st.markdown(f"<h3 style='color: {COLORS['text']}'>Key Phrase</h3>", unsafe_allow_html=True)
-        st.markdown(f"""
-        <div style="background: {COLORS['warning_tint']}; border-left: 4px solid {COLORS['warning']};
-                    padding: 15px; border-radius: 0 8px 8px 0;">
-            <p style="color: {COLORS['text']}; margin: 0; font-style: italic;">
-                "{claude['key_phrase']}"
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(KEY_PHRASE_HEADING_HTML)
+        st.markdown(KEY_PHRASE_TEMPLATE.format(
+            key_phrase=claude['key_phrase'],
+        ), unsafe_allow_html=True)
 
     # Frustration metrics
     metrics = claude.get("frustration_metrics", {})
@@ -530,22 +775,17 @@ def display_case_detail(case: dict):
             # Message-level scores
             message_scores = metrics.get("message_scores", [])
             if message_scores:
-                st.markdown(f"<p style='color: {COLORS['text']}; margin-top: 1rem;'><strong>Message Scores (first 10):</strong></p>", unsafe_allow_html=True)
-                for msg in message_scores[:10]:
-                    score = msg.get('score', 0)
-                    color = get_frustration_color(score)
-                    st.markdown(f"""
-                    <div style="display: flex; align-items: center; margin: 5px 0;">
-                        <span style="background: {color}; color: white; padding: 2px 8px;
-                                     border-radius: 4px; font-weight: bold; min-width: 30px; text-align: center;">
-                            {score}
-                        </span>
-                        <span style="color: {COLORS['text_muted']}; margin-left: 10px; font-size: 0.9rem;">
-                            Msg {msg.get('msg', '?')}: {msg.get('reason', 'No reason provided')}
-                        </span>
-                    </div>
-                    """, unsafe_allow_html=True)
-
+                st.html(MESSAGE_SCORES_HEADING_HTML)
+                rows_html = "".join(
+                    MESSAGE_SCORE_TEMPLATE.format(
+                        color=get_frustration_color(msg.get('score', 0)),
+                        score=msg.get('score', 0),
+                        msg=msg.get('msg', '?'),
+                        reason=msg.get('reason', 'No reason provided'),
+                    )
+                    for msg in message_scores[:10]
+                )
+                st.html(f"<div>{rows_html}</div>")
 
 if __name__ == "__main__":
     main()
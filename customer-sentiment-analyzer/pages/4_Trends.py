@@ -12,11 +12,12 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.dashboard.branding import (
-    COLORS, get_health_color, get_frustration_color,
+    COLORS, SIDEBAR_HEADER_HTML, get_health_color, get_frustration_color,
     get_severity_color, get_priority_color
 )
 from src.dashboard.styles import get_global_css, apply_plotly_theme
-from src.dashboard.filters import get_filtered_cases, get_view_mode_indicator_html
+from src.dashboard.filters import get_view_mode_indicator_html
+from src.dashboard.session import get_view_cases
 
 # Page config
 st.set_page_config(
@@ -30,11 +31,7 @@ st.markdown(get_global_css(), unsafe_allow_html=True)
 
 # Sidebar with view mode toggle
 with st.sidebar:
-    st.markdown(f"""
-    <div style="text-align: center; padding: 0.5rem 0; border-bottom: 1px solid {COLORS['border']}; margin-bottom: 0.75rem;">
-        <h3 style="color: {COLORS['primary']}; margin: 0;">Customer Sentiment</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(SIDEBAR_HEADER_HTML)
 
     # View Mode Toggle - synced across all pages via session state
     if 'view_mode' not in st.session_state:
@@ -292,12 +289,11 @@ def main():
         return
 
     results = st.session_state['analysis_results']
-    cases = results.get("cases", [])
     distributions = results.get("distributions", {})
 
     # Apply view mode filter
     view_mode = st.session_state.get('view_mode', 'All Cases')
-    cases = get_filtered_cases(cases, view_mode)
+    cases = get_view_cases(view_mode)
 
     # Show view mode indicator
     indicator_html = get_view_mode_indicator_html(view_mode, len(cases), COLORS)
@@ -11,9 +11,10 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.dashboard.branding import COLORS
+from src.dashboard.branding import COLORS, SIDEBAR_HEADER_HTML
 from src.dashboard.styles import get_global_css
-from src.dashboard.filters import get_filtered_cases, get_view_mode_indicator_html
+from src.dashboard.filters import get_view_mode_indicator_html
+from src.dashboard.session import get_view_cases
 from src.report_generator import generate_html_report, ReportGenerationError
 
 # Page config
@@ -28,11 +29,7 @@ st.markdown(get_global_css(), unsafe_allow_html=True)
 
 # Sidebar with view mode toggle
 with st.sidebar:
-    st.markdown(f"""
-    <div style="text-align: center; padding: 0.5rem 0; border-bottom: 1px solid {COLORS['border']}; margin-bottom: 0.75rem;">
-        <h3 style="color: {COLORS['primary']}; margin: 0;">Customer Sentiment</h3>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(SIDEBAR_HEADER_HTML)
 
     # View Mode Toggle - synced across all pages via session state
     if 'view_mode' not in st.session_state:
@@ -98,11 +95,10 @@ def main():
         return
 
     results = st.session_state['analysis_results']
-    cases = results.get("cases", [])
 
     # Apply view mode filter
     view_mode = st.session_state.get('view_mode', 'All Cases')
-    cases = get_filtered_cases(cases, view_mode)
+    cases = get_view_cases(view_mode)
 
     # Show view mode indicator
     indicator_html = get_view_mode_indicator_html(view_mode, len(cases), COLORS)
@@ -1,29 +1,32 @@
-"""Source package for Customer Sentiment Analyzer."""
-from .claude_client import ClaudeClient
-from .data_loader import DataLoader, build_enhanced_message_history
-from .scoring import (
-    calculate_criticality_score,
-    add_quick_score_bonus,
-    add_timeline_bonus,
-    calculate_account_health_score,
-    rank_cases,
-    get_frustration_statistics,
-)
-from .sentiment_analyzer import SentimentAnalyzer
-from .visualization import create_all_charts
-from .report_generator import generate_html_report
+"""Source package for Customer Sentiment Analyzer.
 
-__all__ = [
-    "ClaudeClient",
-    "DataLoader",
-    "build_enhanced_message_history",
-    "calculate_criticality_score",
-    "add_quick_score_bonus",
-    "add_timeline_bonus",
-    "calculate_account_health_score",
-    "rank_cases",
-    "get_frustration_statistics",
-    "SentimentAnalyzer",
-    "create_all_charts",
-    "generate_html_report",
-]
+Public names are resolved lazily (PEP 562) so that importing a light
+submodule such as ``src.dashboard.branding`` does not drag in the
+Anthropic SDK, pandas and plotly through this package's __init__.
+"""
+from importlib import import_module
+
+_EXPORTS = {
+    "ClaudeClient": ".claude_client",
+    "DataLoader": ".data_loader",
+    "build_enhanced_message_history": ".data_loader",
+    "calculate_criticality_score": ".scoring",
+    "add_quick_score_bonus": ".scoring",
+    "add_timeline_bonus": ".scoring",
+    "calculate_account_health_score": ".scoring",
+    "rank_cases": ".scoring",
+    "get_frustration_statistics": ".scoring",
+    "SentimentAnalyzer": ".sentiment_analyzer",
+    "create_all_charts": ".visualization",
+    "generate_html_report": ".report_generator",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,10 +4,12 @@ Stores per-message analysis results to avoid re-processing.
 Implements three-gate architecture for efficient analysis triggering.
 """
 
-import json
 import os
-from datetime import datetime, timedelta
+import tempfile
+from datetime import date, datetime, timedelta
+from statistics import fmean
 from typing import Dict, List, Optional, Any, Tuple
+import orjson
 import pandas as pd
 
 from config.settings import (
@@ -15,17 +17,21 @@ from config.settings import (
     GATE1_PEAK_THRESHOLD,
     GATE2_CRITICALITY_THRESHOLD,
     RECENT_WINDOW_DAYS,
+    CLOSED_STATUSES,
     normalize_case_number
 )
+from .atomic_file import match_target_mode
+
+
+def _is_normalized(key: str) -> bool:
+    """Cheap check that a cache key is already in normalize_case_number form."""
+    return bool(key) and (key[0] != '0' or key == '0') and '.' not in key and key == key.strip()
 
 
 class AnalysisCache:
     """Manages cached analysis results for incremental processing."""
 
-    CLOSED_STATUSES = [
-        "Closed", "Closed No Response", "Closed Duplicate",
-        "Closed Spam", "Closed-Test", "Closed-NA"
-    ]
+    CLOSED_STATUSES = CLOSED_STATUSES
 
     def __init__(self, cache_file: str = "data/analysis_cache.json"):
         """Initialize the cache manager.
@@ -35,17 +41,23 @@ class AnalysisCache:
         """
         self.cache_file = cache_file
         self.cache = self._load_cache()
+        # Memo for get_cases_needing_attention: (key, [(case_number, metrics), ...])
+        self._attention_index = None
+
+    def _invalidate_attention_index(self) -> None:
+        """Drop the attention memo - call whenever messages, status or the case set change."""
+        self._attention_index = None
 
     def _load_cache(self) -> Dict:
         """Load cache from disk or create empty structure."""
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cache = json.load(f)
+                with open(self.cache_file, 'rb') as f:
+                    cache = orjson.loads(f.read())
                 # Run migration to normalize case number keys
                 cache = self._migrate_case_numbers(cache)
                 return cache
-            except (json.JSONDecodeError, IOError) as e:
+            except (orjson.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load cache file: {e}")
                 return self._empty_cache()
         return self._empty_cache()
@@ -60,6 +72,10 @@ class AnalysisCache:
         if not old_cases:
             return cache
 
+        # Keys are written normalized, so a current cache loads without rebuilding
+        if all(map(_is_normalized, old_cases)):
+            return cache
+
         new_cases = {}
         migrated = 0
 
@@ -100,15 +116,34 @@ class AnalysisCache:
         }
 
     def save_cache(self) -> None:
-        """Save cache to disk."""
+        """Save cache to disk.
+
+        Serialized with orjson and written to a sibling temp file that is
+        renamed into place, so an interrupted save never truncates the cache.
+        """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+        cache_dir = os.path.dirname(self.cache_file) or "."
+        os.makedirs(cache_dir, exist_ok=True)
 
         # Update metadata counts
         self._update_metadata_counts()
+        self._invalidate_attention_index()
 
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(self.cache, f, indent=2, default=str)
+        payload = orjson.dumps(
+            self.cache,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".json.tmp")
+        try:
+            with open(fd, 'wb') as f:
+                f.write(payload)
+            match_target_mode(tmp_path, self.cache_file)
+            os.replace(tmp_path, self.cache_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def _update_metadata_counts(self) -> None:
         """Update case counts in metadata."""
@@ -218,6 +253,7 @@ class AnalysisCache:
             case_data: Full case data to store
         """
         case_number = normalize_case_number(case_number)
+        self._invalidate_attention_index()
         existing = self.get_cached_case(case_number)
 
         if existing:
@@ -262,6 +298,7 @@ class AnalysisCache:
             message_data: Message analysis data with date, frustration, summary, etc.
         """
         case_number = normalize_case_number(case_number)
+        self._invalidate_attention_index()
         case = self.get_cached_case(case_number)
 
         if not case:
@@ -317,6 +354,7 @@ class AnalysisCache:
                 updated += 1
 
         if updated:
+            self._invalidate_attention_index()
             self.cache["metadata"]["last_closed_upload"] = datetime.now().isoformat()
 
         return updated
@@ -367,8 +405,8 @@ class AnalysisCache:
                 pass
 
         # Calculate averages
-        recent_avg = sum(recent_scores) / len(recent_scores) if recent_scores else 0
-        historical_avg = sum(historical_scores) / len(historical_scores) if historical_scores else 0
+        recent_avg = fmean(recent_scores) if recent_scores else 0
+        historical_avg = fmean(historical_scores) if historical_scores else 0
 
         # Determine trend
         if not recent_scores:
@@ -434,28 +472,33 @@ class AnalysisCache:
         Returns:
             List of case data for cases needing attention
         """
-        attention_cases = []
-
-        for case_number, case in self.get_all_cases(include_closed=False).items():
-            metrics = self.calculate_recent_metrics(case_number, window_days)
-
-            # Flag if declining or high recent frustration
-            needs_attention = (
-                metrics["has_recent_activity"] and
-                (metrics["trend"] == "declining" or metrics["recent_frustration"] >= min_frustration)
-            )
-
-            if needs_attention:
-                attention_cases.append({
-                    "case_number": case_number,
-                    **case,
-                    "calculated_metrics": metrics
-                })
-
-        # Sort by recent frustration descending
-        attention_cases.sort(key=lambda x: x["calculated_metrics"]["recent_frustration"], reverse=True)
-
-        return attention_cases
+        # Metrics are relative to today, so the memo key includes the date
+        key = (window_days, min_frustration, date.today())
+        if self._attention_index is None or self._attention_index[0] != key:
+            flagged = []
+            for case_number in self.get_all_cases(include_closed=False):
+                metrics = self.calculate_recent_metrics(case_number, window_days)
+
+                # Flag if declining or high recent frustration
+                needs_attention = (
+                    metrics["has_recent_activity"] and
+                    (metrics["trend"] == "declining" or metrics["recent_frustration"] >= min_frustration)
+                )
+
+                if needs_attention:
+                    flagged.append((case_number, metrics))
+
+            # Sort by recent frustration descending
+            flagged.sort(key=lambda x: x[1]["recent_frustration"], reverse=True)
+            self._attention_index = (key, flagged)
+
+        # Build the result from live case data so non-metric fields are never stale
+        cases = self.cache.get("cases", {})
+        return [
+            {"case_number": case_number, **cases[case_number], "calculated_metrics": metrics}
+            for case_number, metrics in self._attention_index[1]
+            if case_number in cases
+        ]
 
     def clear_case(self, case_number: str) -> bool:
         """Remove a case from the cache (for re-analysis).
@@ -469,12 +512,14 @@ class AnalysisCache:
         case_number = normalize_case_number(case_number)
         if case_number in self.cache.get("cases", {}):
             del self.cache["cases"][case_number]
+            self._invalidate_attention_index()
             return True
         return False
 
     def clear_all(self) -> None:
         """Clear entire cache."""
         self.cache = self._empty_cache()
+        self._invalidate_attention_index()
 
     def get_cache_stats(self) -> Dict:
         """Get statistics about the cache.
@@ -600,6 +645,7 @@ class AnalysisCache:
             True if Gate 1 threshold crossed (needs Gate 2 analysis)
         """
         case_number = normalize_case_number(case_number)
+        self._invalidate_attention_index()
         case = self.get_cached_case(case_number)
 
         if not case:
@@ -645,7 +691,7 @@ class AnalysisCache:
         ]
 
         if all_frustrations:
-            case["avg_frustration"] = round(sum(all_frustrations) / len(all_frustrations), 2)
+            case["avg_frustration"] = round(fmean(all_frustrations), 2)
             case["peak_frustration"] = max(all_frustrations)
         else:
             case["avg_frustration"] = 0
@@ -689,6 +735,7 @@ class AnalysisCache:
             case_data: Full case dict with all analysis results
         """
         case_number = normalize_case_number(case_number)
+        self._invalidate_attention_index()
         case = self.get_cached_case(case_number)
 
         if not case:
@@ -0,0 +1,38 @@
+"""
+Helpers for files written to a temp file and renamed into place.
+
+tempfile.mkstemp creates its file with mode 0600 and os.replace keeps that
+mode, so without a fix-up every atomic save would silently tighten the
+target's permissions.
+"""
+
+import os
+import stat
+
+
+def _current_umask() -> int:
+    """Read the process umask (the only portable way is to set and restore it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Read once at import: umask is process-wide and setting it is not thread-safe
+_DEFAULT_MODE = 0o666 & ~_current_umask()
+
+
+def match_target_mode(tmp_path, target) -> None:
+    """Give a temp file the permissions its rename target should end up with.
+
+    Call before os.replace(tmp_path, target). An existing target keeps its
+    current mode; a new one gets the mode open() would have created it with.
+
+    Args:
+        tmp_path: Temp file about to be renamed over target
+        target: Final path of the file
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        mode = _DEFAULT_MODE
+    os.chmod(tmp_path, mode)
@@ -21,7 +21,7 @@ load_dotenv()
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import (
-    MODELS, MAX_RETRIES, RETRY_DELAY, MAX_TOKENS, TRUENAS_CONTEXT,
+    MODELS, MAX_RETRIES, RETRY_DELAY, MAX_TOKENS, get_truenas_context,
     TIMELINE_MESSAGE_LIMIT, EXECUTIVE_SUMMARY_LIMIT
 )
 
@@ -107,7 +107,7 @@ class ClaudeClient:
         Returns:
             Dictionary with frustration analysis results
         """
-        context = analysis_context or TRUENAS_CONTEXT
+        context = analysis_context or get_truenas_context()
 
         # ENHANCED HAIKU PROMPT - Business Impact Detection
         prompt = f"""Analyze EACH message in this support case individually for frustration level.
@@ -314,7 +314,7 @@ KEY_PHRASE: [Most concerning customer statement - especially executive mentions
         Returns:
             Dictionary with frustration analysis for new messages
         """
-        context = analysis_context or TRUENAS_CONTEXT
+        context = analysis_context or get_truenas_context()
 
         prompt = f"""Analyze these NEW messages from an ongoing support case.
 
@@ -462,7 +462,7 @@ Respond with:
         Returns:
             Quick scoring results
         """
-        context = analysis_context or TRUENAS_CONTEXT
+        context = analysis_context or get_truenas_context()
         messages = case.get('messages_full', '')
         haiku_analysis = case.get('claude_analysis', {})
         key_phrase = haiku_analysis.get('key_phrase', '')
@@ -576,7 +576,7 @@ IMPORTANT: If the key phrase mentions executives, replacement, or impatience, sc
         Returns:
             Detailed timeline analysis with executive summary
         """
-        context = analysis_context or TRUENAS_CONTEXT
+        context = analysis_context or get_truenas_context()
 
         # Get case data DataFrame
         if case_data is None:
@@ -1092,7 +1092,7 @@ Base your assessment on the timeline patterns identified above."""
         if not new_messages:
             return []
 
-        context = analysis_context or TRUENAS_CONTEXT
+        context = analysis_context or get_truenas_context()
 
         # Build message text from new messages
         message_texts = []
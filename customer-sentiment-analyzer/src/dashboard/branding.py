@@ -3,6 +3,8 @@ Branding and color system for Customer Sentiment Analyzer Dashboard.
 Provides consistent colors, health score helpers, and styling utilities.
 """
 
+from functools import lru_cache
+
 # Color palette - TrueNAS brand colors with Apple-inspired light theme refinement
 COLORS = {
     # TrueNAS Brand Colors (exact match from truenas.com)
@@ -52,6 +54,32 @@ HEALTH_THRESHOLDS = {
 }
 
 
+# Status label -> color tables, built once instead of on every lookup
+PRIORITY_COLORS = {
+    "Critical": COLORS["critical"],
+    "High": COLORS["warning"],
+    "Medium": COLORS["secondary"],
+    "Low": COLORS["success"],
+}
+
+SEVERITY_COLORS = {
+    "S1": COLORS["critical"],
+    "S2": COLORS["warning"],
+    "S3": COLORS["secondary"],
+    "S4": COLORS["text_muted"],
+}
+
+# Sidebar title shared by the main app and every page (render with st.html)
+SIDEBAR_HEADER_HTML = f"""
+    <div style="text-align: center; padding: 0.5rem 0; border-bottom: 1px solid {COLORS['border']}; margin-bottom: 0.75rem;">
+        <h3 style="color: {COLORS['primary']}; margin: 0;">Customer Sentiment</h3>
+    </div>
+    """
+
+
+# The threshold helpers below are memoized - pages call them per table row and
+# per message score, and the inputs come from a small set of repeated values.
+@lru_cache(maxsize=32)
 def get_health_color(score: float) -> str:
     """Get color based on health score.
 
@@ -99,15 +127,10 @@ def get_priority_color(priority: str) -> str:
     Returns:
         Hex color string
     """
-    priority_colors = {
-        "Critical": COLORS["critical"],
-        "High": COLORS["warning"],
-        "Medium": COLORS["secondary"],
-        "Low": COLORS["success"],
-    }
-    return priority_colors.get(priority, COLORS["text_muted"])
+    return PRIORITY_COLORS.get(priority, COLORS["text_muted"])
 
 
+@lru_cache(maxsize=32)
 def get_frustration_color(score: float) -> str:
     """Get color based on frustration score.
 
@@ -127,6 +150,27 @@ def get_frustration_color(score: float) -> str:
         return COLORS["success"]
 
 
+# get_frustration_color as a lookup table for bulk use: bucket i of
+# np.digitize(scores, FRUSTRATION_COLOR_BINS) maps to FRUSTRATION_COLOR_TABLE[i]
+FRUSTRATION_COLOR_BINS = (1, 4, 7)
+FRUSTRATION_COLOR_TABLE = (COLORS["success"], COLORS["secondary"], COLORS["warning"], COLORS["critical"])
+
+
+def get_frustration_colors(scores) -> list:
+    """Vectorized get_frustration_color over a sequence of scores.
+
+    Args:
+        scores: Iterable of frustration scores (0-10)
+
+    Returns:
+        List of hex color strings, one per score
+    """
+    import numpy as np
+    values = np.nan_to_num(np.asarray(scores, dtype=np.float64), nan=0.0)
+    idx = np.digitize(values, FRUSTRATION_COLOR_BINS)
+    return [FRUSTRATION_COLOR_TABLE[i] for i in idx.tolist()]
+
+
 def get_severity_color(severity: str) -> str:
     """Get color for severity level.
 
@@ -136,13 +180,7 @@ def get_severity_color(severity: str) -> str:
     Returns:
         Hex color string
     """
-    severity_colors = {
-        "S1": COLORS["critical"],
-        "S2": COLORS["warning"],
-        "S3": COLORS["secondary"],
-        "S4": COLORS["text_muted"],
-    }
-    return severity_colors.get(severity, COLORS["text_muted"])
+    return SEVERITY_COLORS.get(severity, COLORS["text_muted"])
 
 
 def format_score_badge(score: float, max_score: float = 10) -> str:
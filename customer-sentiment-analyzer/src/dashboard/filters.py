@@ -32,12 +32,13 @@ def filter_recent_issues(cases: List[Dict]) -> List[Dict]:
         Filtered list of cases with recent activity
     """
     recent_issues = []
+    window = RECENT_WINDOW_DAYS  # local lookup inside the loop
 
     for case in cases:
         days_since = case.get("days_since_last_message")
 
         # Simple recency check - no scoring logic here
-        if days_since is not None and days_since <= RECENT_WINDOW_DAYS:
+        if days_since is not None and days_since <= window:
             recent_issues.append(case)
 
     return recent_issues
@@ -0,0 +1,88 @@
+"""
+Session-state helpers for the analysis results shared by every page.
+
+Results are stored together with a token that changes whenever a new results
+object is stored. Pages and caches key on the token to tell "same results as
+last rerun" apart from "new results", instead of each comparing objects their
+own way.
+"""
+
+import uuid
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from .filters import get_filtered_cases
+
+RESULTS_KEY = "analysis_results"
+RESULTS_TOKEN_KEY = "analysis_results_token"
+# Last Recent Issues slice: (results token, filtered cases). Per session, so
+# concurrent sessions never evict or race each other.
+RECENT_ISSUES_MEMO_KEY = "_recent_issues_memo"
+
+
+def set_analysis_results(results: Dict) -> str:
+    """Store results in session state under a fresh token.
+
+    Args:
+        results: Analysis results dictionary
+
+    Returns:
+        The new results token
+    """
+    token = uuid.uuid4().hex
+    st.session_state[RESULTS_KEY] = results
+    st.session_state[RESULTS_TOKEN_KEY] = (results, token)
+    return token
+
+
+def clear_analysis_results():
+    """Remove the results (and their token) from session state."""
+    st.session_state.pop(RESULTS_KEY, None)
+    st.session_state.pop(RESULTS_TOKEN_KEY, None)
+    st.session_state.pop(RECENT_ISSUES_MEMO_KEY, None)
+
+
+def get_results_token() -> Optional[str]:
+    """Token for the results currently in session state.
+
+    Results assigned to session state directly (without set_analysis_results)
+    get a token issued on first use, so the token always tracks the stored object.
+
+    Returns:
+        Token string, or None when no results are loaded
+    """
+    results = st.session_state.get(RESULTS_KEY)
+    if results is None:
+        return None
+    stored = st.session_state.get(RESULTS_TOKEN_KEY)
+    if stored is None or stored[0] is not results:
+        stored = (results, uuid.uuid4().hex)
+        st.session_state[RESULTS_TOKEN_KEY] = stored
+    return stored[1]
+
+
+def get_view_cases(view_mode: str) -> List[Dict]:
+    """Cases from the session's results, filtered for the given view mode.
+
+    The Recent Issues slice is kept in session state and reused on every
+    rerun until the results token changes.
+
+    Args:
+        view_mode: "Recent Issues" or "All Cases"
+
+    Returns:
+        Filtered (or unfiltered) list of cases
+    """
+    results = st.session_state.get(RESULTS_KEY) or {}
+    cases = results.get("cases", [])
+    if view_mode != "Recent Issues":
+        return get_filtered_cases(cases, view_mode)
+
+    token = get_results_token()
+    memo = st.session_state.get(RECENT_ISSUES_MEMO_KEY)
+    if memo is not None and memo[0] == token:
+        return memo[1]
+    filtered = get_filtered_cases(cases, view_mode)
+    st.session_state[RECENT_ISSUES_MEMO_KEY] = (token, filtered)
+    return filtered
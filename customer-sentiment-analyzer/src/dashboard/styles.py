@@ -3,12 +3,18 @@ Global CSS styles for Customer Sentiment Analyzer Dashboard.
 Provides dark theme styling for all Streamlit components.
 """
 
+from functools import lru_cache
+
 from .branding import COLORS
 
 
+@lru_cache(maxsize=1)
 def get_global_css() -> str:
     """Get global CSS for the dashboard.
 
+    The palette is constant, so the string is built once per process and
+    shared by every page on every rerun.
+
     Returns:
         CSS string to inject via st.markdown
     """
@@ -671,6 +677,14 @@ def get_plotly_theme() -> dict:
     }
 
 
+# Built once at import and reused for every figure; update_layout only reads it
+_THEME_LAYOUT = get_plotly_theme()
+_AXIS_FONTS = {
+    "title_font": {"color": COLORS["text"], "size": 13, "family": "Inter, sans-serif"},
+    "tickfont": {"color": COLORS["text_muted"], "size": 11},
+}
+
+
 def apply_plotly_theme(fig):
     """Apply light theme to a Plotly figure.
 
@@ -680,18 +694,11 @@ def apply_plotly_theme(fig):
     Returns:
         Updated figure with theme applied
     """
-    theme = get_plotly_theme()
-    fig.update_layout(**theme)
+    fig.update_layout(**_THEME_LAYOUT)
 
     # Explicitly update axis title fonts to ensure they're visible
     # This is needed because string titles don't inherit from theme
-    fig.update_xaxes(
-        title_font=dict(color=COLORS["text"], size=13, family="Inter, sans-serif"),
-        tickfont=dict(color=COLORS["text_muted"], size=11)
-    )
-    fig.update_yaxes(
-        title_font=dict(color=COLORS["text"], size=13, family="Inter, sans-serif"),
-        tickfont=dict(color=COLORS["text_muted"], size=11)
-    )
+    fig.update_xaxes(**_AXIS_FONTS)
+    fig.update_yaxes(**_AXIS_FONTS)
 
     return fig
@@ -11,7 +11,17 @@ import pandas as pd
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.settings import COLUMN_MAPPINGS, REQUIRED_COLUMNS, OPTIONAL_COLUMNS, normalize_case_number
+from config.settings import (
+    COLUMN_MAPPINGS,
+    ALIAS_TO_CANONICAL,
+    ALIAS_RANK,
+    REQUIRED_COLUMNS,
+    OPTIONAL_COLUMNS,
+    normalize_case_number,
+)
+
+# Excel engines in the order they are tried
+EXCEL_ENGINES = ("calamine", "openpyxl", "xlrd")
 
 
 class DataLoader:
@@ -66,19 +76,26 @@ class DataLoader:
         # Handle different input types
         if isinstance(file, bytes):
             file = io.BytesIO(file)
+        elif hasattr(file, 'seek'):
+            # Seekable file-like object (e.g. Streamlit UploadedFile) - read in place
+            file.seek(0)
         elif hasattr(file, 'read'):
-            # File-like object from Streamlit
+            # Non-seekable stream - buffer once so the fallback engine can rewind
             file = io.BytesIO(file.read())
 
-        try:
-            return pd.read_excel(file, engine="openpyxl", **kwargs)
-        except Exception as e:
+        # calamine (Rust, optional; pandas>=2.2) first; openpyxl/xlrd keep working without it
+        errors = {}
+        for engine in EXCEL_ENGINES:
             try:
                 if hasattr(file, 'seek'):
                     file.seek(0)
-                return pd.read_excel(file, engine="xlrd", **kwargs)
-            except Exception as e2:
-                raise ValueError(f"Failed to load Excel file: {str(e)}")
+                return pd.read_excel(file, engine=engine, **kwargs)
+            except Exception as e:
+                errors[engine] = e
+
+        # Report the openpyxl error - calamine is optional and may simply be missing
+        error = errors.get("openpyxl") or next(iter(errors.values()))
+        raise ValueError(f"Failed to load Excel file: {str(error)}")
 
     def _map_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Map various column names to standard names.
@@ -92,18 +109,24 @@ class DataLoader:
         # Create lowercase mapping
         column_lower = {col.lower(): col for col in df.columns}
 
+        # Exact matches: one reverse-index lookup per sheet column, keeping the
+        # highest-priority alias when several columns map to the same field
+        exact_matches = {}
+        for col_lower, col_actual in column_lower.items():
+            standard_name = ALIAS_TO_CANONICAL.get(col_lower)
+            if standard_name is None:
+                continue
+            rank = ALIAS_RANK[col_lower]
+            if standard_name not in exact_matches or rank < exact_matches[standard_name][0]:
+                exact_matches[standard_name] = (rank, col_actual)
+
         # Find actual column names for each required/optional field
         actual_columns = {}
 
         for standard_name, possible_names in self.column_mapping.items():
-            found = False
-
-            # First try exact match
-            for possible_name in possible_names:
-                if possible_name in column_lower:
-                    actual_columns[standard_name] = column_lower[possible_name]
-                    found = True
-                    break
+            found = standard_name in exact_matches
+            if found:
+                actual_columns[standard_name] = exact_matches[standard_name][1]
 
             # Then try partial match
             if not found:
@@ -0,0 +1,73 @@
+"""
+On-disk encoding of analysis results (data/last_analysis.json).
+
+Kept free of Streamlit so the format can be round-tripped outside the app.
+"""
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import orjson
+
+# Small metadata dicts hoisted to dotted top-level keys on disk ("timing.total_time").
+# Keeps encoder recursion shallow; per-case data stays under "cases" untouched.
+FLATTENED_RESULT_KEYS = ("statistics", "timing", "gate_stats", "distributions")
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def flatten_results(results: dict) -> dict:
+    """Hoist one level of FLATTENED_RESULT_KEYS into dotted top-level keys."""
+    flat = {}
+    for key, value in results.items():
+        if key in FLATTENED_RESULT_KEYS and isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                flat[f"{key}.{sub_key}"] = sub_value
+        else:
+            flat[key] = value
+    return flat
+
+
+def unflatten_results(flat: dict) -> dict:
+    """Inverse of flatten_results. Files saved in nested form pass through unchanged."""
+    results = {}
+    for key, value in flat.items():
+        parent, dot, sub_key = key.partition(".")
+        if dot and parent in FLATTENED_RESULT_KEYS:
+            results.setdefault(parent, {})[sub_key] = value
+        else:
+            results[key] = value
+    return results
+
+
+def coerce(obj):
+    """orjson ``default`` hook for the few types it cannot encode natively.
+
+    orjson already writes datetime and numpy values in C, so only stragglers
+    (pandas Timestamp/NaT, Path, Decimal, numpy scalars without
+    OPT_SERIALIZE_NUMPY support) reach this hook - once per value, with a
+    typed result rather than a blanket str().
+    """
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, "tolist"):  # numpy arrays and scalars
+        return obj.tolist()
+    return str(obj)
+
+
+def encode_results(results: dict) -> bytes:
+    """Serialize results to the on-disk JSON form.
+
+    NaN floats are written as null, so they load back as None.
+    """
+    return orjson.dumps(flatten_results(results), option=ORJSON_OPTIONS, default=coerce)
+
+
+def decode_results(data: bytes) -> dict:
+    """Parse bytes written by encode_results (or an older nested-form file)."""
+    return unflatten_results(orjson.loads(data))
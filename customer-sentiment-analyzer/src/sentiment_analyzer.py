@@ -18,7 +18,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import (
-    TOP_QUICK_SCORE, TOP_DETAILED, TRUENAS_CONTEXT,
+    TOP_QUICK_SCORE, TOP_DETAILED, get_truenas_context,
     GATE1_AVG_THRESHOLD, GATE1_PEAK_THRESHOLD, GATE2_CRITICALITY_THRESHOLD,
     normalize_case_number
 )
@@ -43,7 +43,8 @@ class SentimentAnalyzer:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        progress_callback: Optional[Callable[[str, float], None]] = None
+        progress_callback: Optional[Callable[[str, float], None]] = None,
+        client: Optional[ClaudeClient] = None
     ):
         """Initialize the analyzer.
 
@@ -51,11 +52,12 @@ class SentimentAnalyzer:
             api_key: Optional Anthropic API key
             progress_callback: Optional callback for progress updates
                                Function signature: (message: str, progress: float)
+            client: Optional existing ClaudeClient to reuse (api_key is then ignored)
         """
-        self.client = ClaudeClient(api_key)
+        self.client = client or ClaudeClient(api_key)
         self.loader = DataLoader()
         self.progress_callback = progress_callback
-        self.analysis_context = TRUENAS_CONTEXT
+        self.analysis_context = get_truenas_context()
 
     def _update_progress(self, message: str, progress: float = 0):
         """Send progress update if callback is set."""
@@ -0,0 +1,56 @@
+"""
+Tests for src/analysis_cache.py loading and migration of cache files.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("pandas")
+orjson = pytest.importorskip("orjson")
+
+from src.analysis_cache import AnalysisCache
+
+
+def _write_cache(path, cases):
+    path.write_bytes(orjson.dumps({"cases": cases, "metadata": {}}))
+    return str(path)
+
+
+class TestCaseNumberMigration:
+    """Legacy cache files with unnormalized case keys are migrated on load."""
+
+    def test_legacy_keys_are_normalized(self, tmp_path):
+        """Zero-padded and float-style keys load under their normalized form."""
+        cache_file = _write_cache(tmp_path / "cache.json", {
+            "00090406": {"last_updated": "2024-01-01"},
+            "88784.0": {"last_updated": "2024-01-01"},
+        })
+        cache = AnalysisCache(cache_file)
+        assert set(cache.cache["cases"]) == {"90406", "88784"}
+
+    def test_duplicates_keep_most_recent(self, tmp_path):
+        """Keys that normalize to the same case keep the latest update."""
+        cache_file = _write_cache(tmp_path / "cache.json", {
+            "00090406": {"last_updated": "2024-03-01", "source": "newer"},
+            "90406": {"last_updated": "2024-01-01", "source": "older"},
+        })
+        cache = AnalysisCache(cache_file)
+        assert cache.cache["cases"] == {"90406": {"last_updated": "2024-03-01", "source": "newer"}}
+
+    def test_normalized_cache_loads_unchanged(self, tmp_path):
+        """A cache already in normalized form is returned as stored."""
+        cases = {"90406": {"last_updated": "2024-01-01"}, "0": {"last_updated": "2024-01-01"}}
+        cache = AnalysisCache(_write_cache(tmp_path / "cache.json", cases))
+        assert cache.cache["cases"] == cases
+
+    def test_migrated_cache_saves_normalized(self, tmp_path):
+        """Saving a migrated cache writes the normalized keys back to disk."""
+        cache_file = _write_cache(tmp_path / "cache.json", {"00090406": {"last_updated": "2024-01-01"}})
+        AnalysisCache(cache_file).save_cache()
+        with open(cache_file, "rb") as f:
+            assert list(orjson.loads(f.read())["cases"]) == ["90406"]
@@ -0,0 +1,55 @@
+"""
+Tests for src/data_loader.py column name mapping.
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pd = pytest.importorskip("pandas")
+
+from src.data_loader import DataLoader
+
+
+def _mapped_columns(*columns):
+    df = pd.DataFrame(columns=list(columns))
+    return list(DataLoader()._map_columns(df).columns)
+
+
+class TestMapColumns:
+    """Sheet columns are renamed to the standard names by alias."""
+
+    def test_exact_aliases_are_case_insensitive(self):
+        """Aliases match regardless of capitalisation."""
+        assert _mapped_columns("CASE NUMBER", "Account Name", "Text Body", "Priority") == [
+            "Case Number", "Customer Name", "Message", "Severity",
+        ]
+
+    def test_earliest_alias_wins(self):
+        """With several matching columns, the alias listed first in COLUMN_MAPPINGS wins."""
+        columns = _mapped_columns("Customer", "Account Name", "Case Number", "Text", "Text Body", "Severity")
+        assert columns == ["Customer", "Customer Name", "Case Number", "Text", "Message", "Severity"]
+
+    def test_priority_does_not_depend_on_column_order(self):
+        """The winning alias is the same whichever column comes first in the sheet."""
+        columns = _mapped_columns("Text Body", "Text", "Case Number", "Account Name", "Customer", "Severity")
+        assert columns == ["Message", "Text", "Case Number", "Customer Name", "Customer", "Severity"]
+
+    def test_partial_match_fallback(self):
+        """Columns containing an alias are used when no exact alias exists."""
+        columns = _mapped_columns("Support Case Number", "Customer Name", "Message", "Severity")
+        assert columns[0] == "Case Number"
+
+    def test_optional_columns_mapped(self):
+        """Optional fields are renamed when present."""
+        columns = _mapped_columns("Case Number", "Customer Name", "Message", "Severity", "Support Tier", "Case Status")
+        assert columns[-2:] == ["Support Level", "Status"]
+
+    def test_missing_required_column_raises(self):
+        """A sheet without a required field is rejected."""
+        with pytest.raises(ValueError, match="Missing required column: severity"):
+            _mapped_columns("Case Number", "Customer Name", "Message")
@@ -0,0 +1,87 @@
+"""
+Tests for src/results_store.py - the on-disk format of saved analysis results.
+"""
+
+import sys
+import os
+from datetime import date, datetime
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.results_store import decode_results, encode_results, flatten_results, unflatten_results
+
+
+def _results():
+    return {
+        "cases": [{"case_number": "90406", "frustration_score": 7}],
+        "statistics": {"total_cases": 1, "avg_frustration": 7.0},
+        "timing": {"total_time": 12.5, "claude_time": 10.0},
+        "account_health_score": 82,
+    }
+
+
+class TestFlattenResults:
+    """Metadata dicts are hoisted to dotted keys on disk and restored on load."""
+
+    def test_hoists_nested_metadata(self):
+        """statistics/timing become dotted top-level keys; cases stay nested."""
+        flat = flatten_results(_results())
+        assert flat["statistics.total_cases"] == 1
+        assert flat["timing.total_time"] == 12.5
+        assert "statistics" not in flat
+        assert flat["cases"] == _results()["cases"]
+
+    def test_round_trip(self):
+        """unflatten_results restores exactly what flatten_results hoisted."""
+        assert unflatten_results(flatten_results(_results())) == _results()
+
+    def test_nested_legacy_file_passes_through(self):
+        """Files saved before flattening load unchanged."""
+        assert unflatten_results(_results()) == _results()
+
+    def test_encode_decode_round_trip(self):
+        """The full encode/decode path keeps nested statistics and timing."""
+        assert decode_results(encode_results(_results())) == _results()
+
+
+class TestEncodeValues:
+    """Values JSON cannot hold natively are written in a loadable form."""
+
+    def test_nan_becomes_none(self):
+        """NaN scores (missing analysis) load back as None."""
+        results = _results()
+        results["cases"][0]["frustration_score"] = float("nan")
+        results["statistics"]["avg_frustration"] = float("nan")
+        decoded = decode_results(encode_results(results))
+        assert decoded["cases"][0]["frustration_score"] is None
+        assert decoded["statistics"]["avg_frustration"] is None
+
+    def test_datetimes_become_iso_strings(self):
+        """datetime and date values are written in ISO format."""
+        results = _results()
+        results["cases"][0]["created"] = datetime(2024, 1, 2, 3, 4, 5)
+        results["cases"][0]["due"] = date(2024, 1, 9)
+        case = decode_results(encode_results(results))["cases"][0]
+        assert case["created"] == "2024-01-02T03:04:05"
+        assert case["due"] == "2024-01-09"
+
+    def test_pandas_timestamps_and_nat(self):
+        """Timestamp and NaT go through the coerce hook and parse back with pandas."""
+        pd = pytest.importorskip("pandas")
+        results = _results()
+        results["cases"][0]["created"] = pd.Timestamp("2024-01-02 03:04:05")
+        results["cases"][0]["closed"] = pd.NaT
+        case = decode_results(encode_results(results))["cases"][0]
+        assert case["created"] == "2024-01-02T03:04:05"
+        assert pd.to_datetime(case["closed"]) is pd.NaT
+
+    def test_numpy_scalars(self):
+        """numpy numbers are written as plain JSON numbers."""
+        np = pytest.importorskip("numpy")
+        results = _results()
+        results["cases"][0]["frustration_score"] = np.int64(7)
+        results["statistics"]["avg_frustration"] = np.float64(7.0)
+        assert decode_results(encode_results(results)) == _results()
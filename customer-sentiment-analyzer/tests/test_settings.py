@@ -7,10 +7,14 @@ These tests demonstrate TDD patterns for the scoring helper functions.
 import sys
 import os
 
+import pytest
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config.settings import get_volume_points, get_age_points, get_engagement_points, normalize_case_number
+from config.settings import get_volume_points_array, get_age_points_array, get_engagement_points_array
+from config.settings import get_truenas_context, clear_case_number_cache
 
 
 class TestGetVolumePoints:
@@ -90,6 +94,55 @@ class TestGetEngagementPoints:
         assert get_engagement_points(0.29) == 0
 
 
+class TestPointsArrays:
+    """Vectorized point functions must agree with the scalar ladders."""
+
+    def test_volume_array_matches_scalar(self):
+        """Boundary counts score the same in bulk as one at a time."""
+        pytest.importorskip("numpy")
+        counts = [0, 5, 6, 10, 11, 20, 21, 100]
+        assert get_volume_points_array(counts).tolist() == [get_volume_points(c) for c in counts]
+
+    def test_age_array_matches_scalar(self):
+        """Boundary ages score the same in bulk as one at a time."""
+        pytest.importorskip("numpy")
+        ages = [0, 13, 14, 29, 30, 59, 60, 89, 90, 180]
+        assert get_age_points_array(ages).tolist() == [get_age_points(d) for d in ages]
+
+    def test_engagement_array_matches_scalar(self):
+        """Boundary ratios score the same in bulk as one at a time."""
+        pytest.importorskip("numpy")
+        ratios = [0.0, 0.29, 0.3, 0.49, 0.5, 0.69, 0.7, 1.0]
+        assert get_engagement_points_array(ratios).tolist() == [get_engagement_points(r) for r in ratios]
+
+
+class TestMissingPointInputs:
+    """Missing values (None / NaN) keep the scores the original if/elif ladders gave NaN."""
+
+    @pytest.mark.parametrize("missing", [None, float("nan")])
+    def test_missing_volume_returns_30_points(self, missing):
+        """The old volume ladder fell through to its final branch for NaN."""
+        assert get_volume_points(missing) == 30
+
+    @pytest.mark.parametrize("missing", [None, float("nan")])
+    def test_missing_age_returns_0_points(self, missing):
+        """A case with no usable dates must not score as the oldest case."""
+        assert get_age_points(missing) == 0
+
+    @pytest.mark.parametrize("missing", [None, float("nan")])
+    def test_missing_engagement_returns_0_points(self, missing):
+        """Missing engagement data must not score as maximum engagement."""
+        assert get_engagement_points(missing) == 0
+
+    def test_arrays_match_scalar_for_missing(self):
+        """The vectorized variants treat None and NaN the same way."""
+        pytest.importorskip("numpy")
+        values = [None, float("nan"), 15]
+        assert get_volume_points_array(values).tolist() == [get_volume_points(v) for v in values]
+        assert get_age_points_array(values).tolist() == [get_age_points(v) for v in values]
+        assert get_engagement_points_array(values).tolist() == [get_engagement_points(v) for v in values]
+
+
 class TestNormalizeCaseNumber:
     """Tests for case number normalization function."""
 
@@ -119,6 +172,10 @@ class TestNormalizeCaseNumber:
         """None should return empty string."""
         assert normalize_case_number(None) == ""
 
+    def test_handles_nan(self):
+        """NaN (an empty pandas cell) should return empty string."""
+        assert normalize_case_number(float("nan")) == ""
+
     def test_handles_whitespace(self):
         """Whitespace should be stripped."""
         assert normalize_case_number("  00090406  ") == "90406"
@@ -128,3 +185,24 @@ class TestNormalizeCaseNumber:
         """Already normalized case numbers should remain unchanged."""
         assert normalize_case_number("90406") == "90406"
         assert normalize_case_number("12345") == "12345"
+
+    def test_results_unchanged_after_cache_clear(self):
+        """Clearing the memo only forces recomputation of the same answer."""
+        assert normalize_case_number("00090406") == "90406"
+        clear_case_number_cache()
+        assert normalize_case_number("00090406") == "90406"
+
+
+class TestTruenasContext:
+    """Tests for the lazily loaded TrueNAS prompt context."""
+
+    def test_loads_trimmed_context(self):
+        """Context file should load without surrounding whitespace."""
+        context = get_truenas_context()
+        assert context.startswith("COMPANY & PRODUCT CONTEXT:")
+        assert context == context.strip()
+
+    def test_legacy_constant_matches_getter(self):
+        """TRUENAS_CONTEXT should still resolve for older imports."""
+        from config.settings import TRUENAS_CONTEXT
+        assert TRUENAS_CONTEXT == get_truenas_context()